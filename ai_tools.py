@@ -1,4 +1,11 @@
 """AI tools for the Messaging module."""
+import json
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 from assistant.tools import AssistantTool, register_tool
 
 
@@ -25,7 +32,10 @@ class ListMessageTemplates(AssistantTool):
             qs = qs.filter(channel=args['channel'])
         if 'is_active' in args:
             qs = qs.filter(is_active=args['is_active'])
-        return {"templates": [{"id": str(t.id), "name": t.name, "channel": t.channel, "category": t.category, "subject": t.subject, "is_active": t.is_active} for t in qs]}
+        rows = list(qs.values('id', 'name', 'channel', 'category', 'subject', 'is_active'))
+        for row in rows:
+            row['id'] = str(row['id'])
+        return {"templates": rows}
 
 
 @register_tool
@@ -48,6 +58,11 @@ class CreateMessageTemplate(AssistantTool):
 
     def execute(self, args, request):
         from messaging.models import MessageTemplate
+        if self._validate is not None:
+            try:
+                self._validate(args)
+            except fastjsonschema.JsonSchemaException as exc:
+                return {"error": str(exc)}
         t = MessageTemplate.objects.create(
             name=args['name'], channel=args['channel'], category=args.get('category', ''),
             subject=args.get('subject', ''), body=args['body'],
@@ -78,13 +93,20 @@ class ListMessages(AssistantTool):
             qs = qs.filter(channel=args['channel'])
         if args.get('status'):
             qs = qs.filter(status=args['status'])
-        limit = args.get('limit', 20)
-        return {
-            "messages": [
-                {"id": str(m.id), "channel": m.channel, "recipient_name": m.recipient_name, "subject": m.subject, "status": m.status, "sent_at": m.sent_at.isoformat() if m.sent_at else None}
-                for m in qs.order_by('-created_at')[:limit]
-            ]
-        }
+        limit = min(int(args.get('limit', 20)), 1000)
+        values = qs.order_by('-created_at').values(
+            'id', 'channel', 'recipient_name', 'subject', 'status', 'sent_at'
+        )[:limit]
+        if limit > 200:
+            # Stream big requests in chunks instead of materializing the
+            # whole result set at once.
+            values = values.iterator(chunk_size=200)
+        rows = []
+        for row in values:
+            row['id'] = str(row['id'])
+            row['sent_at'] = row['sent_at'].isoformat() if row['sent_at'] else None
+            rows.append(row)
+        return {"messages": rows}
 
 
 @register_tool
@@ -102,10 +124,17 @@ class ListMessageAutomations(AssistantTool):
 
     def execute(self, args, request):
         from messaging.models import MessageAutomation
-        qs = MessageAutomation.objects.select_related('template').all()
+        qs = MessageAutomation.objects.all()
         if 'is_active' in args:
             qs = qs.filter(is_active=args['is_active'])
-        return {"automations": [{"id": str(a.id), "name": a.name, "trigger": a.trigger, "channel": a.channel, "template": a.template.name if a.template else None, "is_active": a.is_active, "delay_hours": a.delay_hours} for a in qs]}
+        rows = list(
+            qs.values('id', 'name', 'trigger', 'channel', 'is_active', 'delay_hours',
+                      'template__name')
+        )
+        for row in rows:
+            row['id'] = str(row['id'])
+            row['template'] = row.pop('template__name')
+        return {"automations": rows}
 
 
 @register_tool
@@ -129,6 +158,11 @@ class CreateMessageAutomation(AssistantTool):
 
     def execute(self, args, request):
         from messaging.models import MessageAutomation
+        if self._validate is not None:
+            try:
+                self._validate(args)
+            except fastjsonschema.JsonSchemaException as exc:
+                return {"error": str(exc)}
         a = MessageAutomation.objects.create(
             name=args['name'], trigger=args['trigger'], channel=args['channel'],
             template_id=args['template_id'], delay_hours=args.get('delay_hours', 0),
@@ -158,3 +192,25 @@ class DeleteMessage(AssistantTool):
             return {"deleted": True}
         except Message.DoesNotExist:
             return {"error": "Message not found"}
+
+
+# The parameter schemas are static, but the tool manifest is re-sent to the
+# LLM on every assistant turn and the args arrive from the LLM on every
+# call. Pre-serialize each schema once at import time so registries that
+# emit the manifest can reuse the bytes, and compile each schema into a
+# validator function once instead of re-interpreting it per call.
+_TOOLS = (
+    ListMessageTemplates,
+    CreateMessageTemplate,
+    ListMessages,
+    ListMessageAutomations,
+    CreateMessageAutomation,
+    DeleteMessage,
+)
+
+for _tool in _TOOLS:
+    _tool._parameters_json = json.dumps(_tool.parameters, separators=(',', ':')).encode()
+    # staticmethod: a bare function stored on the class would bind as a
+    # method, and self._validate(args) would pass the tool instance as
+    # the data to validate.
+    _tool._validate = staticmethod(fastjsonschema.compile(_tool.parameters)) if fastjsonschema else None
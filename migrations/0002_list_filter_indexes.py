@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['hub_id', 'status', '-created_at'], name='msg_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['hub_id', 'channel', '-created_at'], name='msg_channel_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='messagetemplate',
+            index=models.Index(fields=['hub_id', 'channel', 'is_active'], name='msgtpl_channel_active_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0002_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='messagetemplate',
+            name='body_compiled',
+            field=models.TextField(blank=True, editable=False, help_text='Body pre-translated to str.format form at save time', verbose_name='Compiled Body'),
+        ),
+        migrations.AddField(
+            model_name='messagetemplate',
+            name='subject_compiled',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='Compiled Subject'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+import messaging.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0003_messagetemplate_compiled_fields'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='message',
+            name='metadata',
+            field=models.JSONField(blank=True, decoder=messaging.models.OrjsonJSONDecoder, default=dict, encoder=messaging.models.OrjsonJSONEncoder, verbose_name='Metadata'),
+        ),
+        migrations.AlterField(
+            model_name='campaign',
+            name='target_filter',
+            field=models.JSONField(blank=True, decoder=messaging.models.OrjsonJSONDecoder, default=dict, encoder=messaging.models.OrjsonJSONEncoder, help_text='Customer filter criteria', verbose_name='Target Filter'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0006_shared_channel_choices'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='messageautomation',
+            index=models.Index(fields=['hub_id', 'trigger', 'is_active'], name='msgauto_trigger_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='automationexecution',
+            index=models.Index(fields=['hub_id', 'automation', 'status', '-created_at'], name='autoexec_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='automationexecution',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['hub_id', 'scheduled_for'], name='autoexec_pending_sweep_idx'),
+        ),
+    ]
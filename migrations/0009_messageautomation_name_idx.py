@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0008_automationexecution_processing_status'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='messageautomation',
+            index=models.Index(fields=['hub_id', 'name'], name='msgauto_name_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0009_messageautomation_name_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='message',
+            name='msg_status_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='message',
+            name='msg_channel_created_idx',
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['hub_id', 'is_deleted', '-created_at'], name='msg_list_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['hub_id', 'is_deleted', 'status'], name='msg_list_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['hub_id', 'is_deleted', 'channel'], name='msg_list_channel_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0010_message_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(
+                condition=models.Q(('status__in', ('draft', 'scheduled', 'sending'))),
+                fields=['hub_id', '-updated_at'],
+                name='camp_active_idx',
+            ),
+        ),
+    ]
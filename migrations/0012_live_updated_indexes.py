@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0011_campaign_active_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='messagetemplate',
+            index=models.Index(
+                condition=models.Q(('is_deleted', False)),
+                fields=['hub_id', '-updated_at'],
+                name='msgtpl_live_updated_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(
+                condition=models.Q(('is_deleted', False)),
+                fields=['hub_id', '-updated_at'],
+                name='camp_live_updated_idx',
+            ),
+        ),
+    ]
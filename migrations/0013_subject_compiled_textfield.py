@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0012_live_updated_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='messagetemplate',
+            name='subject_compiled',
+            field=models.TextField(blank=True, editable=False, verbose_name='Compiled Subject'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('messaging', '0013_subject_compiled_textfield'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='messagetemplate',
+            name='msgtpl_live_updated_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='campaign',
+            name='camp_live_updated_idx',
+        ),
+        migrations.AddIndex(
+            model_name='messagetemplate',
+            index=models.Index(
+                fields=['hub_id', '-updated_at'],
+                name='msgtpl_live_updated_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(
+                fields=['hub_id', '-updated_at'],
+                name='camp_live_updated_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+"""Messaging models.
+
+Split per model so workers importing a subset (e.g. the automation
+sender) don't pay import time for the rest. Everything is re-exported
+here, so `from messaging.models import X` keeps working everywhere,
+including the encoder paths recorded in migrations.
+"""
+from .choices import (
+    DIRECT_CHANNEL_CHOICES,
+    AutomationTriggerChoices,
+    CampaignStatusChoices,
+    ChannelChoices,
+    MessageStatusChoices,
+    SMSProviderChoices,
+    TemplateCategoryChoices,
+)
+from .encoders import OrjsonJSONDecoder, OrjsonJSONEncoder
+from .settings import MessagingSettings
+from .template import MessageTemplate
+from .message import Message
+from .campaign import Campaign
+from .automation import AutomationExecution, MessageAutomation
+
+__all__ = [
+    'DIRECT_CHANNEL_CHOICES',
+    'AutomationTriggerChoices',
+    'CampaignStatusChoices',
+    'ChannelChoices',
+    'MessageStatusChoices',
+    'SMSProviderChoices',
+    'TemplateCategoryChoices',
+    'OrjsonJSONDecoder',
+    'OrjsonJSONEncoder',
+    'MessagingSettings',
+    'MessageTemplate',
+    'Message',
+    'Campaign',
+    'AutomationExecution',
+    'MessageAutomation',
+]
@@ -0,0 +1,326 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import HubBaseModel
+
+from .choices import AutomationTriggerChoices, ChannelChoices
+from .message import Message
+from .template import MessageTemplate
+
+
+_TRIGGER_ICONS = {
+    'welcome': 'hand-right-outline',
+    'birthday': 'gift-outline',
+    'anniversary': 'heart-outline',
+    'post_sale': 'cart-outline',
+    'post_appointment': 'calendar-outline',
+    'inactivity': 'time-outline',
+    'loyalty_tier_change': 'trophy-outline',
+    'lead_stage_change': 'funnel-outline',
+    'ticket_resolved': 'checkmark-done-outline',
+    'booking_confirmed': 'globe-outline',
+    'booking_reminder': 'alarm-outline',
+    'custom': 'code-outline',
+}
+
+
+class MessageAutomation(HubBaseModel):
+    """Automated messaging rules that fire on CRM events."""
+
+    name = models.CharField(
+        _('Automation Name'),
+        max_length=200,
+    )
+    description = models.TextField(
+        _('Description'),
+        blank=True,
+    )
+    trigger = models.CharField(
+        _('Trigger'),
+        max_length=30,
+        choices=AutomationTriggerChoices.choices,
+    )
+    channel = models.CharField(
+        _('Channel'),
+        max_length=20,
+        choices=ChannelChoices.choices,
+        default=ChannelChoices.EMAIL,
+    )
+    template = models.ForeignKey(
+        MessageTemplate,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='automations',
+        verbose_name=_('Template'),
+    )
+    delay_hours = models.IntegerField(
+        _('Delay (hours)'),
+        default=0,
+        help_text=_('Hours to wait after trigger before sending'),
+    )
+    is_active = models.BooleanField(
+        _('Active'),
+        default=True,
+    )
+    conditions = models.JSONField(
+        _('Conditions'),
+        default=dict,
+        blank=True,
+        help_text=_('Additional conditions (e.g., inactivity_days: 30)'),
+    )
+    total_sent = models.PositiveIntegerField(
+        _('Total Sent'),
+        default=0,
+    )
+    last_triggered_at = models.DateTimeField(
+        _('Last Triggered'),
+        null=True,
+        blank=True,
+    )
+
+    class Meta(HubBaseModel.Meta):
+        db_table = 'messaging_automation'
+        verbose_name = _('Message Automation')
+        verbose_name_plural = _('Message Automations')
+        ordering = ['name']
+        indexes = [
+            # The dispatcher resolves automations by trigger + active flag.
+            models.Index(fields=['hub_id', 'trigger', 'is_active'], name='msgauto_trigger_active_idx'),
+            # Backs the default ORDER BY name within a hub.
+            models.Index(fields=['hub_id', 'name'], name='msgauto_name_idx'),
+        ]
+
+    # Resolved once; __str__ runs per row in admin lists and logs, and
+    # get_trigger_display() walks the field's choices every call.
+    _TRIGGER_DISPLAY = dict(AutomationTriggerChoices.choices)
+
+    def __str__(self):
+        return f'{self.name} ({self._TRIGGER_DISPLAY.get(self.trigger, self.trigger)})'
+
+    @property
+    def trigger_icon(self):
+        return _TRIGGER_ICONS.get(self.trigger, 'flash-outline')
+
+    @classmethod
+    def with_recent_executions(cls, n=5):
+        """Queryset prefetching the last n executions per automation.
+
+        One windowed prefetch query instead of N reverse lookups when a
+        dashboard shows recent activity per automation; rows land on
+        .recent_executions. Slicing the Prefetch queryset requires
+        Django >= 4.2 (older versions raise on the sliced filter).
+        """
+        return cls.objects.prefetch_related(
+            models.Prefetch(
+                'executions',
+                queryset=AutomationExecution.objects.order_by('-created_at')[:n],
+                to_attr='recent_executions',
+            )
+        )
+
+    SENT_COUNTER_KEY = 'messaging:auto:{}:sent'
+
+    @classmethod
+    def increment_sent(cls, automation_id):
+        """Count a fired message in the cache instead of the DB row.
+
+        High-frequency automations would otherwise contend on an UPDATE
+        per fire; the cache increment is lock-free and the DB sees one
+        write per flush interval via flush_sent_counters().
+        """
+        key = cls.SENT_COUNTER_KEY.format(automation_id)
+        # add() is a no-op when the key exists, so incr never misses.
+        cache.add(key, 0, None)
+        return cache.incr(key)
+
+    @classmethod
+    def flush_sent_counters(cls, automation_ids):
+        """Drain cached counters for the given automations into the DB.
+
+        Meant to run from a periodic task. Totals are statistics, so
+        the small get/delete window losing an increment is acceptable.
+        """
+        counts = {}
+        for pk in automation_ids:
+            key = cls.SENT_COUNTER_KEY.format(pk)
+            n = cache.get(key)
+            if n:
+                cache.delete(key)
+                counts[pk] = n
+        cls.bulk_record_sent(counts)
+        return counts
+
+    @classmethod
+    def bulk_record_sent(cls, counts, ts=None):
+        """Apply per-automation send counters in a few UPDATEs.
+
+        counts maps automation pk -> number of messages sent this batch.
+        F() expressions keep the increments atomic, and grouping pks by
+        count issues one UPDATE per distinct count instead of one per
+        execution.
+        """
+        if not counts:
+            return
+        ts = ts or timezone.now()
+        by_count = {}
+        for pk, n in counts.items():
+            by_count.setdefault(n, []).append(pk)
+        for n, pks in by_count.items():
+            cls.all_objects.filter(pk__in=pks).update(
+                total_sent=models.F('total_sent') + n,
+                last_triggered_at=ts,
+                updated_at=ts,
+            )
+
+
+class AutomationExecution(HubBaseModel):
+    """Log of automation executions."""
+
+    automation = models.ForeignKey(
+        MessageAutomation,
+        on_delete=models.CASCADE,
+        related_name='executions',
+        verbose_name=_('Automation'),
+    )
+    customer = models.ForeignKey(
+        'customers.Customer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='automation_executions',
+        verbose_name=_('Customer'),
+    )
+    message = models.ForeignKey(
+        Message,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='automation_executions',
+        verbose_name=_('Message'),
+    )
+    status = models.CharField(
+        _('Status'),
+        max_length=20,
+        choices=[
+            ('pending', _('Pending')),
+            ('processing', _('Processing')),
+            ('sent', _('Sent')),
+            ('failed', _('Failed')),
+            ('skipped', _('Skipped')),
+        ],
+        default='pending',
+    )
+    trigger_data = models.JSONField(
+        _('Trigger Data'),
+        default=dict,
+        blank=True,
+    )
+    error_message = models.TextField(
+        _('Error'),
+        blank=True,
+    )
+    scheduled_for = models.DateTimeField(
+        _('Scheduled For'),
+        null=True,
+        blank=True,
+    )
+    executed_at = models.DateTimeField(
+        _('Executed At'),
+        null=True,
+        blank=True,
+    )
+
+    class Meta(HubBaseModel.Meta):
+        db_table = 'messaging_automation_execution'
+        verbose_name = _('Automation Execution')
+        verbose_name_plural = _('Automation Executions')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['hub_id', 'automation', 'status', '-created_at'], name='autoexec_status_idx'),
+            # Worker sweep: due pending executions ordered by schedule.
+            models.Index(
+                fields=['hub_id', 'scheduled_for'],
+                name='autoexec_pending_sweep_idx',
+                condition=models.Q(status='pending'),
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.automation.name} -> {self.customer}'
+
+    @classmethod
+    def with_related(cls):
+        """Queryset joining the FKs every list render touches.
+
+        __str__ alone walks automation and customer; fetching them in
+        one JOIN avoids an N+1 per execution row.
+        """
+        return cls.objects.select_related('automation', 'customer', 'message')
+
+    @classmethod
+    def bulk_schedule(cls, automation, customer_ids, trigger_data=None):
+        """Queue pending executions for a customer segment in one batch.
+
+        One multi-row INSERT per 1000 customers instead of a round trip
+        each. bulk_create skips save() signals; nothing in this module
+        listens on AutomationExecution, so that is safe here.
+        """
+        scheduled_for = timezone.now() + timedelta(hours=automation.delay_hours)
+        return cls.objects.bulk_create(
+            [
+                cls(
+                    hub_id=automation.hub_id,
+                    automation=automation,
+                    customer_id=customer_id,
+                    status='pending',
+                    scheduled_for=scheduled_for,
+                    trigger_data=trigger_data or {},
+                )
+                for customer_id in customer_ids
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @classmethod
+    def claim_batch(cls, limit=100):
+        """Atomically claim a batch of due executions for one worker.
+
+        SELECT ... FOR UPDATE SKIP LOCKED lets concurrent workers fan
+        out over the pending queue without double-sending or waiting on
+        each other's locks. Returns the claimed ids, now marked
+        processing; do the actual sending outside this call.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                cls.objects
+                .select_for_update(skip_locked=True)
+                .filter(status='pending', scheduled_for__lte=now)
+                .order_by('scheduled_for')
+                .values_list('id', flat=True)[:limit]
+            )
+            if ids:
+                cls.objects.filter(id__in=ids).update(
+                    status='processing', updated_at=now,
+                )
+        return ids
+
+    @classmethod
+    def pending_batch(cls, limit=100):
+        """Due pending executions with everything the sender needs joined.
+
+        Pulls automation, its template and the customer in the same
+        query so the send loop never goes back to the database per row.
+        """
+        return (
+            cls.objects
+            .filter(status='pending', scheduled_for__lte=timezone.now())
+            .select_related('automation__template', 'customer')
+            .order_by('scheduled_for')[:limit]
+        )
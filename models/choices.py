@@ -0,0 +1,62 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class ChannelChoices(models.TextChoices):
+    WHATSAPP = 'whatsapp', _('WhatsApp')
+    SMS = 'sms', _('SMS')
+    EMAIL = 'email', _('Email')
+    ALL = 'all', _('All Channels')
+
+
+# Messages are always sent over a concrete channel; 'all' only makes sense
+# for templates, campaigns and automations.
+DIRECT_CHANNEL_CHOICES = [
+    (value, label) for value, label in ChannelChoices.choices
+    if value != ChannelChoices.ALL
+]
+
+
+class MessageStatusChoices(models.TextChoices):
+    QUEUED = 'queued', _('Queued')
+    SENT = 'sent', _('Sent')
+    DELIVERED = 'delivered', _('Delivered')
+    FAILED = 'failed', _('Failed')
+    READ = 'read', _('Read')
+
+
+class CampaignStatusChoices(models.TextChoices):
+    DRAFT = 'draft', _('Draft')
+    SCHEDULED = 'scheduled', _('Scheduled')
+    SENDING = 'sending', _('Sending')
+    COMPLETED = 'completed', _('Completed')
+    CANCELLED = 'cancelled', _('Cancelled')
+
+
+class SMSProviderChoices(models.TextChoices):
+    NONE = 'none', _('None')
+    TWILIO = 'twilio', _('Twilio')
+    MESSAGEBIRD = 'messagebird', _('MessageBird')
+
+
+class TemplateCategoryChoices(models.TextChoices):
+    APPOINTMENT_REMINDER = 'appointment_reminder', _('Appointment Reminder')
+    BOOKING_CONFIRMATION = 'booking_confirmation', _('Booking Confirmation')
+    RECEIPT = 'receipt', _('Receipt')
+    MARKETING = 'marketing', _('Marketing')
+    CUSTOM = 'custom', _('Custom')
+
+
+class AutomationTriggerChoices(models.TextChoices):
+    WELCOME = 'welcome', _('New Customer Welcome')
+    BIRTHDAY = 'birthday', _('Birthday')
+    ANNIVERSARY = 'anniversary', _('Anniversary')
+    POST_SALE = 'post_sale', _('After Sale')
+    POST_APPOINTMENT = 'post_appointment', _('After Appointment')
+    INACTIVITY = 'inactivity', _('Customer Inactivity')
+    LOYALTY_TIER_CHANGE = 'loyalty_tier_change', _('Loyalty Tier Change')
+    LEAD_STAGE_CHANGE = 'lead_stage_change', _('Lead Stage Change')
+    TICKET_RESOLVED = 'ticket_resolved', _('Ticket Resolved')
+    BOOKING_CONFIRMED = 'booking_confirmed', _('Booking Confirmed')
+    BOOKING_REMINDER = 'booking_reminder', _('Booking Reminder')
+    CUSTOM = 'custom', _('Custom Trigger')
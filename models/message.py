@@ -0,0 +1,244 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import HubBaseModel
+
+from .choices import DIRECT_CHANNEL_CHOICES, ChannelChoices, MessageStatusChoices
+from .encoders import OrjsonJSONDecoder, OrjsonJSONEncoder
+from .template import MessageTemplate
+
+
+# Lookup tables for display helpers, built once at import time so the
+# properties below don't reconstruct a dict per attribute access.
+_CHANNEL_ICONS = {
+    'whatsapp': 'logo-whatsapp',
+    'sms': 'chatbubble-outline',
+    'email': 'mail-outline',
+}
+
+_MESSAGE_STATUS_COLORS = {
+    'queued': 'color-warning',
+    'sent': 'color-primary',
+    'delivered': 'color-success',
+    'failed': 'color-error',
+    'read': 'color-success',
+}
+
+
+# Lazy label proxies, built once; str() resolves them per call so the
+# active language applies. Caching resolved strings would pin whichever
+# locale happened to be active on the first call.
+_CHANNEL_DISPLAY = dict(ChannelChoices.choices)
+
+
+def _channel_display(channel):
+    """Display string for a channel value in the active language.
+
+    get_channel_display() walks the field's choices per call; the map
+    above skips that scan while the per-call str() keeps translations
+    correct.
+    """
+    return str(_CHANNEL_DISPLAY.get(channel, channel))
+
+
+class Message(HubBaseModel):
+    """Sent message log."""
+
+    channel = models.CharField(
+        _('Channel'),
+        max_length=20,
+        choices=DIRECT_CHANNEL_CHOICES,
+    )
+    recipient_name = models.CharField(
+        _('Recipient Name'),
+        max_length=255,
+        blank=True,
+    )
+    recipient_contact = models.CharField(
+        _('Recipient Contact'),
+        max_length=255,
+        help_text=_('Phone number or email address'),
+    )
+    subject = models.CharField(
+        _('Subject'),
+        max_length=255,
+        blank=True,
+    )
+    body = models.TextField(
+        _('Body'),
+    )
+    status = models.CharField(
+        _('Status'),
+        max_length=20,
+        choices=MessageStatusChoices.choices,
+        default=MessageStatusChoices.QUEUED,
+    )
+    template = models.ForeignKey(
+        MessageTemplate,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='messages',
+        verbose_name=_('Template'),
+    )
+    customer = models.ForeignKey(
+        'customers.Customer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='messages',
+        verbose_name=_('Customer'),
+    )
+    sent_at = models.DateTimeField(
+        _('Sent At'),
+        null=True,
+        blank=True,
+    )
+    delivered_at = models.DateTimeField(
+        _('Delivered At'),
+        null=True,
+        blank=True,
+    )
+    read_at = models.DateTimeField(
+        _('Read At'),
+        null=True,
+        blank=True,
+    )
+    error_message = models.TextField(
+        _('Error Message'),
+        blank=True,
+    )
+    external_id = models.CharField(
+        _('External ID'),
+        max_length=255,
+        blank=True,
+        help_text=_('Provider message ID'),
+    )
+    metadata = models.JSONField(
+        _('Metadata'),
+        default=dict,
+        blank=True,
+        encoder=OrjsonJSONEncoder,
+        decoder=OrjsonJSONDecoder,
+    )
+
+    class Meta(HubBaseModel.Meta):
+        db_table = 'messaging_message'
+        verbose_name = _('Message')
+        verbose_name_plural = _('Messages')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['hub_id', 'channel', 'status', '-created_at']),
+            # Every list/dashboard query filters (hub_id, is_deleted) first;
+            # the third column matches the WHERE or ORDER BY that follows.
+            models.Index(fields=['hub_id', 'is_deleted', '-created_at'], name='msg_list_created_idx'),
+            models.Index(fields=['hub_id', 'is_deleted', 'status'], name='msg_list_status_idx'),
+            models.Index(fields=['hub_id', 'is_deleted', 'channel'], name='msg_list_channel_idx'),
+            # Webhook callbacks look messages up by provider ID alone; most
+            # rows never get one, so only index the ones that do.
+            models.Index(
+                fields=['external_id'],
+                name='msg_external_id_idx',
+                condition=~models.Q(external_id=''),
+            ),
+        ]
+
+    def __str__(self):
+        return f'{_channel_display(self.channel)} -> {self.recipient_contact}'
+
+    @classmethod
+    def light(cls):
+        """Queryset deferring the wide columns list views never render.
+
+        metadata holds raw provider payloads and error_message full
+        tracebacks; neither appears outside the detail page, so list
+        pages can skip fetching them. body stays loaded because the
+        message list renders a truncated preview of it.
+        """
+        return cls.objects.defer('metadata', 'error_message')
+
+    def mark_sent(self):
+        """Mark message as sent."""
+        now = timezone.now()
+        self.status = MessageStatusChoices.SENT
+        self.sent_at = now
+        self.updated_at = now
+        type(self).all_objects.filter(pk=self.pk).update(
+            status=MessageStatusChoices.SENT, sent_at=now, updated_at=now,
+        )
+
+    def mark_delivered(self):
+        """Mark message as delivered."""
+        now = timezone.now()
+        self.status = MessageStatusChoices.DELIVERED
+        self.delivered_at = now
+        self.updated_at = now
+        type(self).all_objects.filter(pk=self.pk).update(
+            status=MessageStatusChoices.DELIVERED, delivered_at=now, updated_at=now,
+        )
+
+    def mark_read(self):
+        """Mark message as read."""
+        now = timezone.now()
+        self.status = MessageStatusChoices.READ
+        self.read_at = now
+        self.updated_at = now
+        type(self).all_objects.filter(pk=self.pk).update(
+            status=MessageStatusChoices.READ, read_at=now, updated_at=now,
+        )
+
+    def mark_failed(self, error=''):
+        """Mark message as failed."""
+        now = timezone.now()
+        self.status = MessageStatusChoices.FAILED
+        self.error_message = error
+        self.updated_at = now
+        type(self).all_objects.filter(pk=self.pk).update(
+            status=MessageStatusChoices.FAILED, error_message=error, updated_at=now,
+        )
+
+    @classmethod
+    def bulk_queue(cls, rows):
+        """Insert a batch of messages in multi-row INSERTs.
+
+        rows is an iterable of field dicts, one per message. Campaign
+        senders should use this instead of create() in a loop.
+        """
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows], batch_size=500,
+        )
+
+    @classmethod
+    def bulk_mark_sent(cls, ids):
+        """Mark a batch of messages as sent in a single UPDATE."""
+        now = timezone.now()
+        return cls.all_objects.filter(pk__in=ids).update(
+            status=MessageStatusChoices.SENT, sent_at=now, updated_at=now,
+        )
+
+    @classmethod
+    def bulk_mark_delivered(cls, ids):
+        """Mark a batch of messages as delivered in a single UPDATE."""
+        now = timezone.now()
+        return cls.all_objects.filter(pk__in=ids).update(
+            status=MessageStatusChoices.DELIVERED, delivered_at=now, updated_at=now,
+        )
+
+    @classmethod
+    def bulk_mark_failed(cls, ids, error=''):
+        """Mark a batch of messages as failed in a single UPDATE."""
+        now = timezone.now()
+        return cls.all_objects.filter(pk__in=ids).update(
+            status=MessageStatusChoices.FAILED, error_message=error, updated_at=now,
+        )
+
+    @property
+    def channel_icon(self):
+        """Return icon name for this channel."""
+        return _CHANNEL_ICONS.get(self.channel, 'chatbubble-outline')
+
+    @property
+    def status_color(self):
+        """Return ux color class for this status."""
+        return _MESSAGE_STATUS_COLORS.get(self.status, '')
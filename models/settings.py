@@ -0,0 +1,145 @@
+from django.core.cache import cache
+from django.db import IntegrityError, models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import HubBaseModel
+
+from .choices import SMSProviderChoices
+
+
+class MessagingSettings(HubBaseModel):
+    """Per-hub messaging configuration."""
+
+    # WhatsApp
+    whatsapp_enabled = models.BooleanField(
+        _('WhatsApp Enabled'),
+        default=False,
+    )
+    whatsapp_api_token = models.CharField(
+        _('WhatsApp API Token'),
+        max_length=500,
+        blank=True,
+    )
+    whatsapp_phone_id = models.CharField(
+        _('WhatsApp Phone ID'),
+        max_length=50,
+        blank=True,
+    )
+    whatsapp_business_id = models.CharField(
+        _('WhatsApp Business ID'),
+        max_length=50,
+        blank=True,
+    )
+
+    # SMS
+    sms_enabled = models.BooleanField(
+        _('SMS Enabled'),
+        default=False,
+    )
+    sms_provider = models.CharField(
+        _('SMS Provider'),
+        max_length=20,
+        choices=SMSProviderChoices.choices,
+        default=SMSProviderChoices.NONE,
+    )
+    sms_api_key = models.CharField(
+        _('SMS API Key'),
+        max_length=255,
+        blank=True,
+    )
+    sms_sender_name = models.CharField(
+        _('SMS Sender Name'),
+        max_length=11,
+        blank=True,
+    )
+
+    # Email
+    email_enabled = models.BooleanField(
+        _('Email Enabled'),
+        default=True,
+    )
+    email_from_name = models.CharField(
+        _('From Name'),
+        max_length=255,
+        blank=True,
+    )
+    email_from_address = models.EmailField(
+        _('From Email Address'),
+        blank=True,
+    )
+    email_smtp_host = models.CharField(
+        _('SMTP Host'),
+        max_length=255,
+        blank=True,
+    )
+    email_smtp_port = models.IntegerField(
+        _('SMTP Port'),
+        default=587,
+    )
+    email_smtp_username = models.CharField(
+        _('SMTP Username'),
+        max_length=255,
+        blank=True,
+    )
+    email_smtp_password = models.CharField(
+        _('SMTP Password'),
+        max_length=255,
+        blank=True,
+    )
+    email_smtp_use_tls = models.BooleanField(
+        _('Use TLS'),
+        default=True,
+    )
+
+    # Automation
+    appointment_reminder_enabled = models.BooleanField(
+        _('Appointment Reminders'),
+        default=False,
+    )
+    appointment_reminder_hours = models.IntegerField(
+        _('Reminder Hours Before'),
+        default=24,
+    )
+    booking_confirmation_enabled = models.BooleanField(
+        _('Booking Confirmations'),
+        default=True,
+    )
+
+    class Meta(HubBaseModel.Meta):
+        db_table = 'messaging_settings'
+        verbose_name = _('Messaging Settings')
+        verbose_name_plural = _('Messaging Settings')
+        unique_together = [('hub_id',)]
+
+    def __str__(self):
+        return str(_('Messaging Settings'))
+
+    CACHE_TIMEOUT = 300
+
+    @classmethod
+    def get_settings(cls, hub_id):
+        """Get or create settings for a hub (cached per hub)."""
+        cache_key = f'messaging:settings:{hub_id}'
+        settings = cache.get(cache_key)
+        if settings is None:
+            # Plain get() skips the savepoint get_or_create wraps around
+            # every call; creation only happens once per hub ever.
+            try:
+                settings = cls.all_objects.get(hub_id=hub_id)
+            except cls.DoesNotExist:
+                try:
+                    settings = cls.all_objects.create(hub_id=hub_id)
+                except IntegrityError:
+                    # Lost the first-hit race; the winner's row exists.
+                    settings = cls.all_objects.get(hub_id=hub_id)
+            cache.set(cache_key, settings, cls.CACHE_TIMEOUT)
+        return settings
+
+
+@receiver(post_save, sender=MessagingSettings)
+@receiver(post_delete, sender=MessagingSettings)
+def _invalidate_settings_cache(sender, instance, **kwargs):
+    """Drop the cached settings when they change or disappear."""
+    cache.delete(f'messaging:settings:{instance.hub_id}')
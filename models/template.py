@@ -0,0 +1,137 @@
+import re
+from functools import lru_cache
+
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.core.models import HubBaseModel
+
+from .choices import ChannelChoices, TemplateCategoryChoices
+
+
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+@lru_cache(maxsize=512)
+def _compile_placeholders(text):
+    """Translate {{key}} placeholders into str.format-style {key} fields.
+
+    Literal braces are doubled so the result can be rendered with a single
+    C-level format_map pass instead of one Python-level scan per key.
+
+    Cached so rows predating the *_compiled columns pay the regex pass
+    once per template text, not once per send.
+    """
+    parts = _PLACEHOLDER_RE.split(text)
+    out = []
+    for i, part in enumerate(parts):
+        if i % 2:
+            out.append('{' + part + '}')
+        else:
+            out.append(part.replace('{', '{{').replace('}', '}}'))
+    return ''.join(out)
+
+
+class _SafeDict(dict):
+    """Leave unknown placeholders intact instead of raising KeyError."""
+
+    def __missing__(self, key):
+        return '{{' + key + '}}'
+
+
+class MessageTemplate(HubBaseModel):
+    """Reusable message templates with variable placeholders."""
+
+    name = models.CharField(
+        _('Template Name'),
+        max_length=200,
+    )
+    channel = models.CharField(
+        _('Channel'),
+        max_length=20,
+        choices=ChannelChoices.choices,
+        default=ChannelChoices.ALL,
+    )
+    category = models.CharField(
+        _('Category'),
+        max_length=30,
+        choices=TemplateCategoryChoices.choices,
+        default=TemplateCategoryChoices.CUSTOM,
+    )
+    subject = models.CharField(
+        _('Subject'),
+        max_length=255,
+        blank=True,
+        help_text=_('Email subject line'),
+    )
+    body = models.TextField(
+        _('Body'),
+        help_text=_('Message body with {{variables}}'),
+    )
+    body_compiled = models.TextField(
+        _('Compiled Body'),
+        blank=True,
+        editable=False,
+        help_text=_('Body pre-translated to str.format form at save time'),
+    )
+    # TextField: doubling literal braces can compile a 255-char subject
+    # into up to 510 chars, and the column is editable=False anyway.
+    subject_compiled = models.TextField(
+        _('Compiled Subject'),
+        blank=True,
+        editable=False,
+    )
+    is_active = models.BooleanField(
+        _('Active'),
+        default=True,
+    )
+    is_system = models.BooleanField(
+        _('System Template'),
+        default=False,
+    )
+
+    class Meta(HubBaseModel.Meta):
+        db_table = 'messaging_template'
+        verbose_name = _('Message Template')
+        verbose_name_plural = _('Message Templates')
+        ordering = ['category', 'name']
+        indexes = [
+            models.Index(fields=['hub_id', 'channel', 'is_active'], name='msgtpl_channel_active_idx'),
+            # Backs the per-render Max(updated_at) cache stamp, which
+            # scans all_objects; no is_deleted condition on purpose, a
+            # partial index could not serve that query.
+            models.Index(
+                fields=['hub_id', '-updated_at'],
+                name='msgtpl_live_updated_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.body_compiled = _compile_placeholders(self.body)
+        self.subject_compiled = _compile_placeholders(self.subject)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'body' in update_fields:
+                update_fields.add('body_compiled')
+            if 'subject' in update_fields:
+                update_fields.add('subject_compiled')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+
+    def render_body(self, context=None):
+        """Render template body with context variables."""
+        if not context:
+            return self.body
+        compiled = self.body_compiled or _compile_placeholders(self.body)
+        return compiled.format_map(_SafeDict(context))
+
+    def render_subject(self, context=None):
+        """Render template subject with context variables."""
+        if not context:
+            return self.subject
+        compiled = self.subject_compiled or _compile_placeholders(self.subject)
+        return compiled.format_map(_SafeDict(context))
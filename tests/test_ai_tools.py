@@ -0,0 +1,49 @@
+"""
+Unit tests for Messaging AI tools.
+"""
+
+import pytest
+
+from messaging import ai_tools
+
+
+pytestmark = [pytest.mark.django_db(transaction=False), pytest.mark.unit]
+
+# The validation paths only exist when the optional dependency is there;
+# without it the tools fall back to unvalidated execution.
+requires_validator = pytest.mark.skipif(
+    ai_tools.fastjsonschema is None, reason='fastjsonschema not installed',
+)
+
+
+class TestCreateMessageTemplate:
+    """Tests for the create_message_template tool."""
+
+    @requires_validator
+    def test_execute_with_validator(self):
+        # Regression: the compiled validator stored as a class attribute
+        # bound as a method and received the tool instance as the data,
+        # so every call failed with "data must be object".
+        tool = ai_tools.CreateMessageTemplate()
+        result = tool.execute(
+            {'name': 'Tool Template', 'channel': 'sms', 'body': 'Hi {{customer_name}}'},
+            None,
+        )
+        assert 'error' not in result
+        assert result['created'] is True
+
+    @requires_validator
+    def test_execute_rejects_invalid_args(self):
+        tool = ai_tools.CreateMessageTemplate()
+        result = tool.execute({'name': 'No body or channel'}, None)
+        assert 'error' in result
+
+
+class TestCreateMessageAutomation:
+    """Tests for the create_message_automation tool."""
+
+    @requires_validator
+    def test_execute_rejects_invalid_args(self):
+        tool = ai_tools.CreateMessageAutomation()
+        result = tool.execute({'name': 'Missing trigger'}, None)
+        assert 'error' in result
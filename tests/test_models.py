@@ -2,11 +2,13 @@
 Unit tests for Messaging models.
 """
 
+from datetime import timedelta
+
 import pytest
 from django.utils import timezone
 
 
-pytestmark = [pytest.mark.django_db, pytest.mark.unit]
+pytestmark = [pytest.mark.django_db(transaction=False), pytest.mark.unit]
 
 
 # ---------------------------------------------------------------------------
@@ -94,6 +96,28 @@ class TestMessageTemplate:
         rendered = message_template.render_subject()
         assert '{{business_name}}' in rendered
 
+    def test_compiled_on_save(self, message_template):
+        assert '{customer_name}' in message_template.body_compiled
+        assert '{business_name}' in message_template.subject_compiled
+
+    def test_render_body_literal_braces(self, hub_id):
+        from messaging.models import MessageTemplate
+        template = MessageTemplate.objects.create(
+            hub_id=hub_id, name='Braces', body='Use {curly} and {{customer_name}}',
+        )
+        rendered = template.render_body({'customer_name': 'Maria'})
+        assert rendered == 'Use {curly} and Maria'
+
+    def test_compiled_subject_longer_than_source(self, hub_id):
+        from messaging.models import MessageTemplate
+        # Doubled literal braces may compile past the subject's 255-char
+        # cap; the compiled column must accept the longer form.
+        template = MessageTemplate.objects.create(
+            hub_id=hub_id, name='Braced Subject', body='body', subject='{' * 255,
+        )
+        template.refresh_from_db()
+        assert template.subject_compiled == '{{' * 255
+
     def test_ordering(self, hub_id):
         from messaging.models import MessageTemplate
         t1 = MessageTemplate.objects.create(
@@ -171,6 +195,51 @@ class TestMessage:
         assert msg.status == 'failed'
         assert msg.error_message == 'SMTP connection timeout'
 
+    def test_bulk_mark_sent(self, hub_id):
+        from messaging.models import Message
+        # bulk_create: one INSERT for the whole fixture set.
+        msgs = Message.objects.bulk_create(
+            Message(
+                hub_id=hub_id, channel='sms',
+                recipient_contact='+34600', body='Test',
+                status='queued',
+            )
+            for _ in range(3)
+        )
+        updated = Message.bulk_mark_sent([m.pk for m in msgs])
+        assert updated == 3
+        for m in msgs:
+            m.refresh_from_db()
+            assert m.status == 'sent'
+            assert m.sent_at is not None
+
+    def test_bulk_queue(self, hub_id):
+        from messaging.models import Message
+        created = Message.bulk_queue([
+            {
+                'hub_id': hub_id, 'channel': 'sms',
+                'recipient_contact': f'+3460{i}', 'body': 'Hello',
+            }
+            for i in range(3)
+        ])
+        assert len(created) == 3
+        # Count the created pks, not the whole hub: session fixtures
+        # commit messages for the same hub outside this transaction.
+        pks = [m.pk for m in created]
+        assert Message.objects.filter(pk__in=pks).count() == 3
+
+    def test_bulk_mark_failed(self, hub_id):
+        from messaging.models import Message
+        msg = Message.objects.create(
+            hub_id=hub_id, channel='email',
+            recipient_contact='a@b.com', body='Test',
+            status='queued',
+        )
+        Message.bulk_mark_failed([msg.pk], error='Bounced')
+        msg.refresh_from_db()
+        assert msg.status == 'failed'
+        assert msg.error_message == 'Bounced'
+
     def test_channel_icon(self, hub_id):
         from messaging.models import Message
         wa = Message.objects.create(
@@ -351,10 +420,179 @@ class TestCampaign:
     def test_campaign_with_template(self, campaign, message_template):
         assert campaign.template.name == 'Appointment Reminder'
 
+    def test_with_metrics(self, sending_campaign):
+        from messaging.models import Campaign
+        row = Campaign.with_metrics().get(pk=sending_campaign.pk)
+        # 20 delivered / 25 sent = 80%; 25 sent / 50 recipients = 50%.
+        assert row.delivery_rate_pct == 80.0
+        assert row.progress_pct == 50.0
+        # The Python properties keep working on annotated rows.
+        assert row.delivery_rate == 80.0
+
+    def test_with_metrics_zero_counts(self, campaign):
+        from messaging.models import Campaign
+        row = Campaign.with_metrics().get(pk=campaign.pk)
+        assert row.delivery_rate_pct == 0.0
+        assert row.progress_pct == 0.0
+
     def test_target_filter_default(self, campaign):
         assert campaign.target_filter == {}
 
 
+# ---------------------------------------------------------------------------
+# MessageAutomation
+# ---------------------------------------------------------------------------
+
+class TestMessageAutomation:
+    """Tests for MessageAutomation model."""
+
+    def test_with_recent_executions(self, hub_id):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Welcome', trigger='welcome', channel='sms',
+        )
+        for _ in range(3):
+            AutomationExecution.objects.create(
+                hub_id=hub_id, automation=automation, status='sent',
+            )
+        # Evaluate the queryset: the sliced Prefetch pins the Django 4.2
+        # version floor and only fails at evaluation time.
+        rows = list(MessageAutomation.with_recent_executions(n=2))
+        row = next(a for a in rows if a.pk == automation.pk)
+        assert len(row.recent_executions) == 2
+        assert all(e.automation_id == automation.pk for e in row.recent_executions)
+
+    def test_increment_sent_counts_in_cache(self, hub_id):
+        from messaging.models import MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Birthday', trigger='birthday', channel='email',
+        )
+        assert MessageAutomation.increment_sent(automation.pk) == 1
+        assert MessageAutomation.increment_sent(automation.pk) == 2
+        # No DB write until the counters are flushed.
+        automation.refresh_from_db()
+        assert automation.total_sent == 0
+
+    def test_flush_sent_counters(self, hub_id):
+        from messaging.models import MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Anniversary', trigger='anniversary', channel='sms',
+        )
+        MessageAutomation.increment_sent(automation.pk)
+        MessageAutomation.increment_sent(automation.pk)
+        counts = MessageAutomation.flush_sent_counters([automation.pk])
+        assert counts == {automation.pk: 2}
+        automation.refresh_from_db()
+        assert automation.total_sent == 2
+        assert automation.last_triggered_at is not None
+        # The counter is drained: a second flush is a no-op.
+        assert MessageAutomation.flush_sent_counters([automation.pk]) == {}
+
+    def test_bulk_record_sent(self, hub_id):
+        from messaging.models import MessageAutomation
+        first = MessageAutomation.objects.create(
+            hub_id=hub_id, name='First', trigger='welcome', channel='sms',
+        )
+        second = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Second', trigger='post_sale', channel='email',
+        )
+        MessageAutomation.bulk_record_sent({first.pk: 2, second.pk: 3})
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.total_sent == 2
+        assert second.total_sent == 3
+        assert first.last_triggered_at is not None
+        assert second.last_triggered_at is not None
+
+
+# ---------------------------------------------------------------------------
+# AutomationExecution
+# ---------------------------------------------------------------------------
+
+class TestAutomationExecution:
+    """Tests for AutomationExecution worker helpers."""
+
+    def test_bulk_schedule(self, hub_id, customer):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Post Sale', trigger='post_sale',
+            channel='sms', delay_hours=2,
+        )
+        created = AutomationExecution.bulk_schedule(
+            automation, [customer.pk], trigger_data={'sale_id': '42'},
+        )
+        assert len(created) == 1
+        execution = AutomationExecution.objects.get(pk=created[0].pk)
+        assert execution.status == 'pending'
+        assert execution.customer_id == customer.pk
+        assert execution.trigger_data == {'sale_id': '42'}
+        # delay_hours pushes the schedule into the future.
+        assert execution.scheduled_for > timezone.now() + timedelta(hours=1)
+
+    def test_claim_batch(self, hub_id):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Inactivity', trigger='inactivity', channel='email',
+        )
+        now = timezone.now()
+        due = [
+            AutomationExecution.objects.create(
+                hub_id=hub_id, automation=automation, status='pending',
+                scheduled_for=now - timedelta(minutes=i + 1),
+            )
+            for i in range(2)
+        ]
+        future = AutomationExecution.objects.create(
+            hub_id=hub_id, automation=automation, status='pending',
+            scheduled_for=now + timedelta(hours=1),
+        )
+        claimed = AutomationExecution.claim_batch(limit=10)
+        assert set(claimed) == {e.pk for e in due}
+        for e in due:
+            e.refresh_from_db()
+            assert e.status == 'processing'
+        future.refresh_from_db()
+        assert future.status == 'pending'
+        # Everything due is already claimed.
+        assert AutomationExecution.claim_batch(limit=10) == []
+
+    def test_claim_batch_respects_limit(self, hub_id):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Welcome Burst', trigger='welcome', channel='sms',
+        )
+        now = timezone.now()
+        oldest = AutomationExecution.objects.create(
+            hub_id=hub_id, automation=automation, status='pending',
+            scheduled_for=now - timedelta(hours=2),
+        )
+        AutomationExecution.objects.create(
+            hub_id=hub_id, automation=automation, status='pending',
+            scheduled_for=now - timedelta(hours=1),
+        )
+        claimed = AutomationExecution.claim_batch(limit=1)
+        # Oldest schedule wins the single slot.
+        assert claimed == [oldest.pk]
+
+    def test_pending_batch(self, hub_id, customer):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation = MessageAutomation.objects.create(
+            hub_id=hub_id, name='Reminder', trigger='booking_reminder', channel='sms',
+        )
+        due = AutomationExecution.objects.create(
+            hub_id=hub_id, automation=automation, customer=customer,
+            status='pending', scheduled_for=timezone.now() - timedelta(minutes=5),
+        )
+        not_due = AutomationExecution.objects.create(
+            hub_id=hub_id, automation=automation, status='pending',
+            scheduled_for=timezone.now() + timedelta(hours=1),
+        )
+        batch = list(AutomationExecution.pending_batch(limit=10))
+        pks = [e.pk for e in batch]
+        assert due.pk in pks
+        assert not_due.pk not in pks
+
+
 # ---------------------------------------------------------------------------
 # Indexes
 # ---------------------------------------------------------------------------
@@ -366,3 +604,46 @@ class TestMessageIndexes:
         from messaging.models import Message
         index_fields = [idx.fields for idx in Message._meta.indexes]
         assert ['hub_id', 'channel', 'status', '-created_at'] in index_fields
+        assert ['hub_id', 'is_deleted', '-created_at'] in index_fields
+        assert ['hub_id', 'is_deleted', 'status'] in index_fields
+        assert ['hub_id', 'is_deleted', 'channel'] in index_fields
+
+    def test_external_id_index_is_partial(self):
+        from messaging.models import Message
+        index = {idx.name: idx for idx in Message._meta.indexes}['msg_external_id_idx']
+        assert index.fields == ['external_id']
+        assert index.condition is not None
+
+    def test_template_indexes_exist(self):
+        from messaging.models import MessageTemplate
+        index_fields = [idx.fields for idx in MessageTemplate._meta.indexes]
+        assert ['hub_id', 'channel', 'is_active'] in index_fields
+
+    def test_automation_indexes_exist(self):
+        from messaging.models import AutomationExecution, MessageAutomation
+        automation_fields = [idx.fields for idx in MessageAutomation._meta.indexes]
+        assert ['hub_id', 'trigger', 'is_active'] in automation_fields
+        execution_fields = [idx.fields for idx in AutomationExecution._meta.indexes]
+        assert ['hub_id', 'automation', 'status', '-created_at'] in execution_fields
+
+    def test_campaign_active_index_is_partial(self):
+        from messaging.models import Campaign
+        index = {idx.name: idx for idx in Campaign._meta.indexes}['camp_active_idx']
+        assert index.fields == ['hub_id', '-updated_at']
+        assert index.condition is not None
+
+    def test_updated_at_indexes_are_not_partial(self):
+        # The cache-stamp query scans all_objects, so a partial index
+        # conditioned on is_deleted could not serve it.
+        from messaging.models import Campaign, MessageTemplate
+        tpl_index = {idx.name: idx for idx in MessageTemplate._meta.indexes}['msgtpl_live_updated_idx']
+        camp_index = {idx.name: idx for idx in Campaign._meta.indexes}['camp_live_updated_idx']
+        for index in (tpl_index, camp_index):
+            assert index.fields == ['hub_id', '-updated_at']
+            assert index.condition is None
+
+    def test_pending_sweep_index_is_partial(self):
+        from messaging.models import AutomationExecution
+        index = {idx.name: idx for idx in AutomationExecution._meta.indexes}['autoexec_pending_sweep_idx']
+        assert index.fields == ['hub_id', 'scheduled_for']
+        assert index.condition is not None
@@ -4,97 +4,197 @@ Integration tests for Messaging views.
 
 import json
 import uuid
+from importlib import import_module
+
 import pytest
-from django.test import Client
+from django.test import Client, RequestFactory
+from django.urls import reverse
 from django.utils import timezone
 
-
-pytestmark = [pytest.mark.django_db, pytest.mark.unit]
+# Model imports at module scope: pytest-django has already run
+# django.setup() by collection time, and hoisting them keeps each test
+# from re-entering the import machinery per call.
+from apps.accounts.models import LocalUser
+from apps.configuration.models import HubConfig, StoreConfig
+
+from messaging import views
+from messaging.models import Campaign, Message, MessageTemplate, MessagingSettings
+
+
+# transaction=False (the default, stated here on purpose): tests run
+# inside a rolled-back atomic block instead of flushing tables, which
+# is what keeps the per-test DB cost to savepoints.
+pytestmark = [pytest.mark.django_db(transaction=False), pytest.mark.unit]
+
+# Resolved once at import; per-test literals would re-run the URL
+# resolver on every request and go stale if the mount point moves.
+DASHBOARD_URL = reverse('messaging:dashboard')
+MESSAGES_URL = reverse('messaging:messages')
+COMPOSE_URL = reverse('messaging:send_message')
+TEMPLATES_URL = reverse('messaging:templates')
+TEMPLATE_CREATE_URL = reverse('messaging:template_create')
+CAMPAIGNS_URL = reverse('messaging:campaigns')
+CAMPAIGN_CREATE_URL = reverse('messaging:campaign_create')
+API_SEND_URL = reverse('messaging:api_send')
+API_SEND_BATCH_URL = reverse('messaging:api_send_batch')
+API_WEBHOOK_URL = reverse('messaging:api_webhook')
+SETTINGS_URL = reverse('messaging:settings')
+SETTINGS_SAVE_URL = reverse('messaging:settings_save')
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(autouse=True)
-def _set_hub_config(db, settings):
-    """Ensure HubConfig + StoreConfig exist so middleware won't redirect."""
-    from apps.configuration.models import HubConfig, StoreConfig
-    config = HubConfig.get_solo()
-    config.save()
-    store = StoreConfig.get_solo()
-    store.business_name = 'Test Business'
-    store.is_configured = True
-    store.save()
+@pytest.fixture(scope='session', autouse=True)
+def _set_hub_config(django_db_setup, django_db_blocker):
+    """Seed HubConfig + StoreConfig once so middleware won't redirect.
+
+    Session-scoped: the config rows are committed outside the per-test
+    transactions, so every test reuses them instead of re-saving the
+    singletons per function.
+    """
+    with django_db_blocker.unblock():
+        config = HubConfig.get_solo()
+        config.save()
+        store = StoreConfig.get_solo()
+        store.business_name = 'Test Business'
+        store.is_configured = True
+        store.save()
+
+
+@pytest.fixture(scope='session')
+def hub_id(_set_hub_config, django_db_blocker):
+    with django_db_blocker.unblock():
+        return HubConfig.get_solo().hub_id
+
+
+@pytest.fixture(scope='session')
+def employee(_set_hub_config, django_db_blocker):
+    """Shared read-only local user, created once per session.
+
+    get_or_create: the row is committed outside the per-test
+    transactions, so under --reuse-db it survives into the next run.
+    """
+    with django_db_blocker.unblock():
+        return LocalUser.objects.get_or_create(
+            email='employee@test.com',
+            defaults={
+                'name': 'Test Employee',
+                'role': 'admin',
+                'is_active': True,
+            },
+        )[0]
 
 
-@pytest.fixture
-def hub_id(db):
-    from apps.configuration.models import HubConfig
-    return HubConfig.get_solo().hub_id
-
-
-@pytest.fixture
-def employee(db):
-    """Create a local user (employee)."""
-    from apps.accounts.models import LocalUser
-    return LocalUser.objects.create(
-        name='Test Employee',
-        email='employee@test.com',
-        role='admin',
-        is_active=True,
-    )
-
-
-@pytest.fixture
-def auth_client(employee):
-    """Authenticated Django test client."""
-    client = Client()
-    session = client.session
+@pytest.fixture(autouse=True)
+def _cookie_sessions(settings):
+    """Keep test sessions in signed cookies.
+
+    The default DB backend writes a session row per authenticated test
+    and reads it back on every request; the cookie backend removes
+    those round-trips entirely.
+    """
+    settings.SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
+
+@pytest.fixture(scope='session')
+def auth_cookie(employee):
+    """Signed session cookie for the shared employee, built once.
+
+    The signed-cookie backend derives the cookie value from the session
+    payload and SECRET_KEY, both constant for the whole run, so there
+    is no reason to rebuild (or store) a session per test.
+    """
+    engine = import_module('django.contrib.sessions.backends.signed_cookies')
+    session = engine.SessionStore()
     session['local_user_id'] = str(employee.id)
     session['user_name'] = employee.name
     session['user_email'] = employee.email
     session['user_role'] = employee.role
     session['store_config_checked'] = True
     session.save()
-    return client
+    return session.session_key
 
 
 @pytest.fixture
-def sample_template(hub_id):
-    """Create a sample message template."""
-    from messaging.models import MessageTemplate
-    return MessageTemplate.objects.create(
-        hub_id=hub_id,
-        name='Test Template',
-        channel='all',
-        category='custom',
-        subject='Test Subject',
-        body='Hello {{customer_name}}, test message.',
-        is_active=True,
-    )
+def auth_client(auth_cookie, settings):
+    """Authenticated Django test client."""
+    client = Client()
+    client.cookies[settings.SESSION_COOKIE_NAME] = auth_cookie
+    return client
 
 
-@pytest.fixture
-def sample_message(hub_id, sample_template):
-    """Create a sample message."""
-    from messaging.models import Message
-    return Message.objects.create(
-        hub_id=hub_id,
-        channel='whatsapp',
-        recipient_name='Maria Garcia',
-        recipient_contact='+34600123456',
-        body='Test message content',
-        status='sent',
-        template=sample_template,
-        sent_at=timezone.now(),
+@pytest.fixture(scope='session')
+def rf():
+    """RequestFactory for JSON endpoints that need no middleware.
+
+    Template views stay on Client: they depend on session auth, the
+    htmx partial negotiation and the messages framework. The webhook is
+    public, CSRF-exempt JSON, so calling the view directly skips the
+    whole middleware stack per request.
+    """
+    return RequestFactory()
+
+
+def _post_webhook(rf, body):
+    """POST a payload straight to the api_webhook view."""
+    if not isinstance(body, (str, bytes)):
+        body = json.dumps(body)
+    request = rf.post(
+        API_WEBHOOK_URL, data=body, content_type='application/json',
     )
+    return views.api_webhook(request)
+
+
+@pytest.fixture(scope='session')
+def sample_template(hub_id, django_db_blocker):
+    """Shared read-only template, created once per session.
+
+    Tests that mutate a template create their own row instead of
+    touching this one. get_or_create keeps reused databases from
+    accumulating a copy per run.
+    """
+    with django_db_blocker.unblock():
+        return MessageTemplate.objects.get_or_create(
+            hub_id=hub_id,
+            name='Test Template',
+            defaults={
+                'channel': 'all',
+                'category': 'custom',
+                'subject': 'Test Subject',
+                'body': 'Hello {{customer_name}}, test message.',
+                'is_active': True,
+            },
+        )[0]
+
+
+@pytest.fixture(scope='session')
+def sample_message(hub_id, sample_template, django_db_blocker):
+    """Shared read-only message, created once per session.
+
+    Messages have no natural key, so the fixture claims a fixed
+    external_id to stay idempotent across --reuse-db runs.
+    """
+    with django_db_blocker.unblock():
+        return Message.objects.get_or_create(
+            hub_id=hub_id,
+            external_id='pytest-sample-message',
+            defaults={
+                'channel': 'whatsapp',
+                'recipient_name': 'Maria Garcia',
+                'recipient_contact': '+34600123456',
+                'body': 'Test message content',
+                'status': 'sent',
+                'template': sample_template,
+                'sent_at': timezone.now(),
+            },
+        )[0]
 
 
 @pytest.fixture
 def sample_campaign(hub_id, sample_template):
     """Create a sample campaign."""
-    from messaging.models import Campaign
     return Campaign.objects.create(
         hub_id=hub_id,
         name='Test Campaign',
@@ -108,7 +208,6 @@ def sample_campaign(hub_id, sample_template):
 @pytest.fixture
 def sample_settings(hub_id):
     """Create messaging settings."""
-    from messaging.models import MessagingSettings
     return MessagingSettings.objects.create(
         hub_id=hub_id,
         email_enabled=True,
@@ -123,17 +222,17 @@ def sample_settings(hub_id):
 
 class TestDashboard:
 
-    def test_dashboard_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/')
-        assert response.status_code == 200
-
-    def test_dashboard_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/', HTTP_HX_REQUEST='true')
+    @pytest.mark.parametrize('headers', [
+        pytest.param({}, id='load'),
+        pytest.param({'HTTP_HX_REQUEST': 'true'}, id='htmx'),
+    ])
+    def test_dashboard(self, auth_client, headers):
+        response = auth_client.get(DASHBOARD_URL, **headers)
         assert response.status_code == 200
 
     def test_requires_login(self):
         client = Client()
-        response = client.get('/m/messaging/')
+        response = client.get(DASHBOARD_URL)
         assert response.status_code == 302
 
 
@@ -143,63 +242,51 @@ class TestDashboard:
 
 class TestMessagesList:
 
-    def test_messages_list_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/messages/')
-        assert response.status_code == 200
-
-    def test_messages_list_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/messages/', HTTP_HX_REQUEST='true')
-        assert response.status_code == 200
-
-    def test_messages_list_with_data(self, auth_client, sample_message):
-        response = auth_client.get('/m/messaging/messages/')
-        assert response.status_code == 200
-
-    def test_messages_filter_by_channel(self, auth_client, sample_message):
-        response = auth_client.get('/m/messaging/messages/?channel=whatsapp')
-        assert response.status_code == 200
-
-    def test_messages_filter_by_status(self, auth_client, sample_message):
-        response = auth_client.get('/m/messaging/messages/?status=sent')
-        assert response.status_code == 200
-
-    def test_messages_search(self, auth_client, sample_message):
-        response = auth_client.get('/m/messaging/messages/?q=Maria')
+    # Variants differ only by query string / htmx header; one
+    # parametrized body shares the client and fixture setup.
+    @pytest.mark.parametrize('qs,headers', [
+        pytest.param('', {}, id='load'),
+        pytest.param('', {'HTTP_HX_REQUEST': 'true'}, id='htmx'),
+        pytest.param('?channel=whatsapp', {}, id='filter-channel'),
+        pytest.param('?status=sent', {}, id='filter-status'),
+        pytest.param('?q=Maria', {}, id='search'),
+    ])
+    def test_messages_list(self, auth_client, sample_message, qs, headers):
+        response = auth_client.get(MESSAGES_URL + qs, **headers)
         assert response.status_code == 200
 
 
 class TestMessageDetail:
 
     def test_detail_loads(self, auth_client, sample_message):
-        response = auth_client.get(f'/m/messaging/messages/{sample_message.pk}/')
+        response = auth_client.get(reverse('messaging:message_detail', args=[sample_message.pk]))
         assert response.status_code == 200
 
     def test_detail_htmx(self, auth_client, sample_message):
         response = auth_client.get(
-            f'/m/messaging/messages/{sample_message.pk}/',
+            reverse('messaging:message_detail', args=[sample_message.pk]),
             HTTP_HX_REQUEST='true',
         )
         assert response.status_code == 200
 
     def test_detail_not_found(self, auth_client):
         fake_uuid = uuid.uuid4()
-        response = auth_client.get(f'/m/messaging/messages/{fake_uuid}/')
+        response = auth_client.get(reverse('messaging:message_detail', args=[fake_uuid]))
         assert response.status_code == 404
 
 
 class TestSendMessage:
 
     def test_compose_form_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/messages/compose/')
+        response = auth_client.get(COMPOSE_URL)
         assert response.status_code == 200
 
     def test_compose_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/messages/compose/', HTTP_HX_REQUEST='true')
+        response = auth_client.get(COMPOSE_URL, HTTP_HX_REQUEST='true')
         assert response.status_code == 200
 
     def test_send_message_success(self, auth_client, hub_id):
-        from messaging.models import Message
-        response = auth_client.post('/m/messaging/messages/compose/', {
+        response = auth_client.post(COMPOSE_URL, {
             'channel': 'email',
             'recipient_name': 'Test User',
             'recipient_contact': 'test@example.com',
@@ -216,32 +303,24 @@ class TestSendMessage:
 
 class TestTemplatesList:
 
-    def test_templates_list_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/templates/')
-        assert response.status_code == 200
-
-    def test_templates_list_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/templates/', HTTP_HX_REQUEST='true')
-        assert response.status_code == 200
-
-    def test_templates_with_data(self, auth_client, sample_template):
-        response = auth_client.get('/m/messaging/templates/')
-        assert response.status_code == 200
-
-    def test_templates_search(self, auth_client, sample_template):
-        response = auth_client.get('/m/messaging/templates/?q=Test')
+    @pytest.mark.parametrize('qs,headers', [
+        pytest.param('', {}, id='load'),
+        pytest.param('', {'HTTP_HX_REQUEST': 'true'}, id='htmx'),
+        pytest.param('?q=Test', {}, id='search'),
+    ])
+    def test_templates_list(self, auth_client, sample_template, qs, headers):
+        response = auth_client.get(TEMPLATES_URL + qs, **headers)
         assert response.status_code == 200
 
 
 class TestTemplateCreate:
 
     def test_create_form_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/templates/create/')
+        response = auth_client.get(TEMPLATE_CREATE_URL)
         assert response.status_code == 200
 
     def test_create_template(self, auth_client, hub_id):
-        from messaging.models import MessageTemplate
-        response = auth_client.post('/m/messaging/templates/create/', {
+        response = auth_client.post(TEMPLATE_CREATE_URL, {
             'name': 'New Template',
             'channel': 'email',
             'category': 'custom',
@@ -256,11 +335,15 @@ class TestTemplateCreate:
 class TestTemplateEdit:
 
     def test_edit_form_loads(self, auth_client, sample_template):
-        response = auth_client.get(f'/m/messaging/templates/{sample_template.pk}/edit/')
+        response = auth_client.get(reverse('messaging:template_edit', args=[sample_template.pk]))
         assert response.status_code == 200
 
-    def test_edit_template(self, auth_client, sample_template):
-        response = auth_client.post(f'/m/messaging/templates/{sample_template.pk}/edit/', {
+    def test_edit_template(self, auth_client, hub_id):
+        tmpl = MessageTemplate.objects.create(
+            hub_id=hub_id, name='Editable Template', channel='all',
+            category='custom', body='Original body',
+        )
+        response = auth_client.post(reverse('messaging:template_edit', args=[tmpl.pk]), {
             'name': 'Updated Template',
             'channel': 'sms',
             'category': 'marketing',
@@ -269,20 +352,25 @@ class TestTemplateEdit:
             'is_active': 'on',
         })
         assert response.status_code == 200
-        sample_template.refresh_from_db()
-        assert sample_template.name == 'Updated Template'
+        tmpl.refresh_from_db()
+        assert tmpl.name == 'Updated Template'
 
 
 class TestTemplateDelete:
 
-    def test_delete_template(self, auth_client, sample_template):
-        response = auth_client.post(f'/m/messaging/templates/{sample_template.pk}/delete/')
-        assert response.status_code == 200
-        sample_template.refresh_from_db()
-        assert sample_template.is_deleted is True
+    def test_delete_template(self, auth_client, hub_id):
+        tmpl = MessageTemplate.objects.create(
+            hub_id=hub_id, name='Deletable Template', channel='all',
+            category='custom', body='Body',
+        )
+        response = auth_client.post(reverse('messaging:template_delete', args=[tmpl.pk]))
+        # 204 + HX-Trigger: the list partial refreshes itself.
+        assert response.status_code == 204
+        assert response.headers['HX-Trigger'] == 'messagingListChanged'
+        tmpl.refresh_from_db()
+        assert tmpl.is_deleted is True
 
     def test_delete_system_template_prevented(self, auth_client, hub_id):
-        from messaging.models import MessageTemplate
         system_tmpl = MessageTemplate.objects.create(
             hub_id=hub_id,
             name='System Template',
@@ -291,8 +379,8 @@ class TestTemplateDelete:
             body='System body',
             is_system=True,
         )
-        response = auth_client.post(f'/m/messaging/templates/{system_tmpl.pk}/delete/')
-        assert response.status_code == 200
+        response = auth_client.post(reverse('messaging:template_delete', args=[system_tmpl.pk]))
+        assert response.status_code == 204
         system_tmpl.refresh_from_db()
         assert system_tmpl.is_deleted is False
 
@@ -303,32 +391,24 @@ class TestTemplateDelete:
 
 class TestCampaignsList:
 
-    def test_campaigns_list_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/campaigns/')
-        assert response.status_code == 200
-
-    def test_campaigns_list_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/campaigns/', HTTP_HX_REQUEST='true')
-        assert response.status_code == 200
-
-    def test_campaigns_with_data(self, auth_client, sample_campaign):
-        response = auth_client.get('/m/messaging/campaigns/')
-        assert response.status_code == 200
-
-    def test_campaigns_filter_status(self, auth_client, sample_campaign):
-        response = auth_client.get('/m/messaging/campaigns/?status=draft')
+    @pytest.mark.parametrize('qs,headers', [
+        pytest.param('', {}, id='load'),
+        pytest.param('', {'HTTP_HX_REQUEST': 'true'}, id='htmx'),
+        pytest.param('?status=draft', {}, id='filter-status'),
+    ])
+    def test_campaigns_list(self, auth_client, sample_campaign, qs, headers):
+        response = auth_client.get(CAMPAIGNS_URL + qs, **headers)
         assert response.status_code == 200
 
 
 class TestCampaignCreate:
 
     def test_create_form_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/campaigns/create/')
+        response = auth_client.get(CAMPAIGN_CREATE_URL)
         assert response.status_code == 200
 
     def test_create_campaign(self, auth_client, hub_id, sample_template):
-        from messaging.models import Campaign
-        response = auth_client.post('/m/messaging/campaigns/create/', {
+        response = auth_client.post(CAMPAIGN_CREATE_URL, {
             'name': 'New Campaign',
             'description': 'Test campaign',
             'channel': 'email',
@@ -341,12 +421,12 @@ class TestCampaignCreate:
 class TestCampaignDetail:
 
     def test_detail_loads(self, auth_client, sample_campaign):
-        response = auth_client.get(f'/m/messaging/campaigns/{sample_campaign.pk}/')
+        response = auth_client.get(reverse('messaging:campaign_detail', args=[sample_campaign.pk]))
         assert response.status_code == 200
 
     def test_detail_htmx(self, auth_client, sample_campaign):
         response = auth_client.get(
-            f'/m/messaging/campaigns/{sample_campaign.pk}/',
+            reverse('messaging:campaign_detail', args=[sample_campaign.pk]),
             HTTP_HX_REQUEST='true',
         )
         assert response.status_code == 200
@@ -355,19 +435,20 @@ class TestCampaignDetail:
 class TestCampaignStart:
 
     def test_start_draft_campaign(self, auth_client, sample_campaign):
-        response = auth_client.post(f'/m/messaging/campaigns/{sample_campaign.pk}/start/')
-        assert response.status_code == 200
+        response = auth_client.post(reverse('messaging:campaign_start', args=[sample_campaign.pk]))
+        # 204 + HX-Trigger: the detail partial refreshes itself.
+        assert response.status_code == 204
+        assert response.headers['HX-Trigger'] == 'messagingListChanged'
         sample_campaign.refresh_from_db()
         assert sample_campaign.status == 'sending'
 
     def test_start_completed_campaign_fails(self, auth_client, hub_id):
-        from messaging.models import Campaign
         c = Campaign.objects.create(
             hub_id=hub_id, name='Done', channel='sms',
             status='completed',
         )
-        response = auth_client.post(f'/m/messaging/campaigns/{c.pk}/start/')
-        assert response.status_code == 200
+        response = auth_client.post(reverse('messaging:campaign_start', args=[c.pk]))
+        assert response.status_code == 204
         c.refresh_from_db()
         assert c.status == 'completed'
 
@@ -375,19 +456,19 @@ class TestCampaignStart:
 class TestCampaignCancel:
 
     def test_cancel_draft_campaign(self, auth_client, sample_campaign):
-        response = auth_client.post(f'/m/messaging/campaigns/{sample_campaign.pk}/cancel/')
-        assert response.status_code == 200
+        response = auth_client.post(reverse('messaging:campaign_cancel', args=[sample_campaign.pk]))
+        assert response.status_code == 204
+        assert response.headers['HX-Trigger'] == 'messagingListChanged'
         sample_campaign.refresh_from_db()
         assert sample_campaign.status == 'cancelled'
 
     def test_cancel_completed_campaign_fails(self, auth_client, hub_id):
-        from messaging.models import Campaign
         c = Campaign.objects.create(
             hub_id=hub_id, name='Done', channel='sms',
             status='completed',
         )
-        response = auth_client.post(f'/m/messaging/campaigns/{c.pk}/cancel/')
-        assert response.status_code == 200
+        response = auth_client.post(reverse('messaging:campaign_cancel', args=[c.pk]))
+        assert response.status_code == 204
         c.refresh_from_db()
         assert c.status == 'completed'
 
@@ -400,7 +481,7 @@ class TestAPISend:
 
     def test_api_send_success(self, auth_client, hub_id):
         response = auth_client.post(
-            '/m/messaging/api/send/',
+            API_SEND_URL,
             data=json.dumps({
                 'channel': 'whatsapp',
                 'recipient_contact': '+34600123456',
@@ -414,35 +495,68 @@ class TestAPISend:
         assert data['success'] is True
         assert 'message_id' in data
 
-    def test_api_send_missing_fields(self, auth_client):
+    @pytest.mark.parametrize('body', [
+        pytest.param(json.dumps({'channel': 'sms'}), id='missing_fields'),
+        pytest.param(json.dumps({
+            'channel': 'telegram',
+            'recipient_contact': '+34600',
+            'body': 'Test',
+        }), id='invalid_channel'),
+        pytest.param('not json', id='invalid_json'),
+    ])
+    def test_api_send_errors(self, auth_client, body):
         response = auth_client.post(
-            '/m/messaging/api/send/',
-            data=json.dumps({'channel': 'sms'}),
-            content_type='application/json',
+            API_SEND_URL, data=body, content_type='application/json',
         )
         assert response.status_code == 400
-        data = response.json()
-        assert data['success'] is False
+        assert response.json()['success'] is False
+
+
+class TestAPISendBatch:
 
-    def test_api_send_invalid_channel(self, auth_client):
+    def test_batch_send_success(self, auth_client, hub_id):
         response = auth_client.post(
-            '/m/messaging/api/send/',
-            data=json.dumps({
-                'channel': 'telegram',
-                'recipient_contact': '+34600',
-                'body': 'Test',
-            }),
+            API_SEND_BATCH_URL,
+            data=json.dumps({'messages': [
+                {
+                    'channel': 'whatsapp',
+                    'recipient_contact': '+34600123456',
+                    'body': 'Hello!',
+                },
+                {
+                    'channel': 'email',
+                    'recipient_contact': 'batch@example.com',
+                    'subject': 'Batch',
+                    'body': 'Hello again!',
+                },
+            ]}),
             content_type='application/json',
         )
-        assert response.status_code == 400
-
-    def test_api_send_invalid_json(self, auth_client):
+        assert response.status_code == 200
+        data = response.json()
+        assert data['success'] is True
+        assert data['count'] == 2
+        assert Message.objects.filter(
+            pk__in=data['message_ids'], hub_id=hub_id, status='sent',
+        ).count() == 2
+
+    @pytest.mark.parametrize('body', [
+        pytest.param(json.dumps({}), id='missing_list'),
+        pytest.param(json.dumps({'messages': []}), id='empty_list'),
+        pytest.param(json.dumps({'messages': [{'channel': 'sms'}]}), id='missing_fields'),
+        pytest.param(json.dumps({'messages': [{
+            'channel': 'telegram',
+            'recipient_contact': '+34600',
+            'body': 'Test',
+        }]}), id='invalid_channel'),
+        pytest.param('not json', id='invalid_json'),
+    ])
+    def test_batch_send_errors(self, auth_client, body):
         response = auth_client.post(
-            '/m/messaging/api/send/',
-            data='not json',
-            content_type='application/json',
+            API_SEND_BATCH_URL, data=body, content_type='application/json',
         )
         assert response.status_code == 400
+        assert response.json()['success'] is False
 
 
 # ---------------------------------------------------------------------------
@@ -451,111 +565,58 @@ class TestAPISend:
 
 class TestAPIWebhook:
 
-    def test_webhook_delivered(self, hub_id):
-        from messaging.models import Message
-        msg = Message.objects.create(
-            hub_id=hub_id, channel='whatsapp',
-            recipient_contact='+34600', body='Test',
-            status='sent', external_id='ext_001',
-        )
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data=json.dumps({
-                'external_id': 'ext_001',
-                'status': 'delivered',
-            }),
-            content_type='application/json',
-        )
-        assert response.status_code == 200
-        msg.refresh_from_db()
-        assert msg.status == 'delivered'
-
-    def test_webhook_failed(self, hub_id):
-        from messaging.models import Message
-        msg = Message.objects.create(
-            hub_id=hub_id, channel='sms',
-            recipient_contact='+34600', body='Test',
-            status='sent', external_id='ext_002',
-        )
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data=json.dumps({
-                'external_id': 'ext_002',
-                'status': 'failed',
-                'error': 'Number not reachable',
-            }),
-            content_type='application/json',
-        )
-        assert response.status_code == 200
-        msg.refresh_from_db()
-        assert msg.status == 'failed'
-        assert msg.error_message == 'Number not reachable'
-
-    def test_webhook_read(self, hub_id):
-        from messaging.models import Message
+    @pytest.mark.parametrize(
+        'initial_status,payload_extra,expected_status,expected_error',
+        [
+            pytest.param('sent', {'status': 'delivered'}, 'delivered', '', id='delivered'),
+            pytest.param(
+                'sent', {'status': 'failed', 'error': 'Number not reachable'},
+                'failed', 'Number not reachable', id='failed',
+            ),
+            pytest.param('delivered', {'status': 'read'}, 'read', '', id='read'),
+        ],
+    )
+    def test_webhook_status_update(self, hub_id, rf, initial_status,
+                                   payload_extra, expected_status, expected_error):
+        # Unique per run so parallel workers sharing a reused database
+        # never collide on the provider ID.
+        external_id = f'ext_{uuid.uuid4().hex}'
         msg = Message.objects.create(
             hub_id=hub_id, channel='whatsapp',
             recipient_contact='+34600', body='Test',
-            status='delivered', external_id='ext_003',
-        )
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data=json.dumps({
-                'external_id': 'ext_003',
-                'status': 'read',
-            }),
-            content_type='application/json',
+            status=initial_status, external_id=external_id,
         )
+        response = _post_webhook(rf, {'external_id': external_id, **payload_extra})
         assert response.status_code == 200
         msg.refresh_from_db()
-        assert msg.status == 'read'
-
-    def test_webhook_not_found(self):
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data=json.dumps({
-                'external_id': 'nonexistent',
-                'status': 'delivered',
-            }),
-            content_type='application/json',
-        )
-        assert response.status_code == 404
-
-    def test_webhook_missing_fields(self):
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data=json.dumps({'status': 'delivered'}),
-            content_type='application/json',
-        )
-        assert response.status_code == 400
-
-    def test_webhook_invalid_json(self):
-        client = Client()
-        response = client.post(
-            '/m/messaging/api/webhook/',
-            data='not json',
-            content_type='application/json',
-        )
-        assert response.status_code == 400
+        assert msg.status == expected_status
+        assert msg.error_message == expected_error
+
+    @pytest.mark.parametrize(
+        'body,expected_code',
+        [
+            pytest.param({'external_id': 'nonexistent', 'status': 'delivered'}, 404, id='not_found'),
+            pytest.param({'status': 'delivered'}, 400, id='missing_fields'),
+            pytest.param('not json', 400, id='invalid_json'),
+        ],
+    )
+    def test_webhook_errors(self, rf, body, expected_code):
+        response = _post_webhook(rf, body)
+        assert response.status_code == expected_code
 
     def test_webhook_no_csrf_required(self, hub_id):
         """Webhook should work without CSRF token (csrf_exempt)."""
-        from messaging.models import Message
+        external_id = f'ext_{uuid.uuid4().hex}'
         msg = Message.objects.create(
             hub_id=hub_id, channel='whatsapp',
             recipient_contact='+34600', body='Test',
-            status='sent', external_id='ext_csrf_test',
+            status='sent', external_id=external_id,
         )
         client = Client(enforce_csrf_checks=True)
         response = client.post(
-            '/m/messaging/api/webhook/',
+            API_WEBHOOK_URL,
             data=json.dumps({
-                'external_id': 'ext_csrf_test',
+                'external_id': external_id,
                 'status': 'delivered',
             }),
             content_type='application/json',
@@ -570,18 +631,17 @@ class TestAPIWebhook:
 class TestSettings:
 
     def test_settings_loads(self, auth_client):
-        response = auth_client.get('/m/messaging/settings/')
+        response = auth_client.get(SETTINGS_URL)
         assert response.status_code == 200
 
     def test_settings_htmx(self, auth_client):
-        response = auth_client.get('/m/messaging/settings/', HTTP_HX_REQUEST='true')
+        response = auth_client.get(SETTINGS_URL, HTTP_HX_REQUEST='true')
         assert response.status_code == 200
 
     def test_settings_save(self, auth_client, hub_id):
-        from messaging.models import MessagingSettings
         # First, ensure settings exist
         MessagingSettings.get_settings(hub_id)
-        response = auth_client.post('/m/messaging/settings/save/', {
+        response = auth_client.post(SETTINGS_SAVE_URL, {
             'whatsapp_enabled': 'on',
             'whatsapp_api_token': 'new-token',
             'whatsapp_phone_id': '111',
@@ -34,6 +34,7 @@ urlpatterns = [
 
     # API
     path('api/send/', views.api_send, name='api_send'),
+    path('api/send/batch/', views.api_send_batch, name='api_send_batch'),
     path('api/webhook/', views.api_webhook, name='api_webhook'),
 
     # Settings
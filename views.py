@@ -6,15 +6,19 @@ and API endpoints for programmatic sending and delivery webhooks.
 """
 import json
 
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
-from django.http import JsonResponse
-from django.shortcuts import get_object_or_404, render as django_render
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.http import Http404, HttpResponse, JsonResponse
+from django.shortcuts import render as django_render
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST, require_http_methods
 from django.contrib import messages as django_messages
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from apps.accounts.decorators import login_required, public_view, permission_required
 from apps.core.htmx import htmx_view
@@ -38,17 +42,155 @@ from .forms import (
     MessagingSettingsForm,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 # ============================================================================
 # Helpers
 # ============================================================================
 
 def _hub_id(request):
-    return request.session.get('hub_id')
+    # Memoized per request: every view calls this, and the session
+    # backend may deserialize the whole payload per lookup.
+    hub = getattr(request, '_messaging_hub_id', None)
+    if hub is None:
+        hub = request.session.get('hub_id')
+        request._messaging_hub_id = hub
+    return hub
+
+
+def _get_or_404(model, pk, hub, related=()):
+    """Fetch a live row by primary key, scoped to the current hub.
+
+    Looks up by pk alone so the query is a single primary-key probe,
+    then enforces hub scoping and soft-delete in Python; filtering the
+    extra predicates in SQL makes the planner combine indexes for a
+    row the pk already pins down. related names FKs the caller will
+    render, joined into the same query.
+    """
+    qs = model.all_objects
+    if related:
+        qs = qs.select_related(*related)
+    try:
+        obj = qs.get(pk=pk)
+    except model.DoesNotExist:
+        raise Http404(f'No {model._meta.object_name} matches the given query.')
+    if str(obj.hub_id) != str(hub) or obj.is_deleted:
+        raise Http404(f'No {model._meta.object_name} matches the given query.')
+    return obj
+
+
+def _load_json(body):
+    """Parse a JSON request body; raises ValueError on bad input.
+
+    orjson parses a few times faster than the stdlib, which matters on
+    the webhook endpoint. orjson.JSONDecodeError subclasses ValueError,
+    so call sites catch one exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _json_response(data, status=200):
+    """JSON response, serialized with orjson when it is installed.
+
+    default=str resolves the lazy translation strings the error
+    payloads carry, mirroring what DjangoJSONEncoder does for Promise.
+    """
+    if orjson is not None:
+        return HttpResponse(
+            orjson.dumps(data, default=str),
+            content_type='application/json',
+            status=status,
+        )
+    return JsonResponse(data, status=status)
+
+
+COUNTERS_CACHE_TIMEOUT = 300
+
+
+def _hub_counters(hub):
+    """Message/template/campaign totals for the settings page, cached.
+
+    The settings page is read far more often than messaging data
+    changes; caching the totals per hub skips the counting on repeat
+    hits, and the receivers below drop the key on any write.
+    """
+    def count_subquery(model):
+        return Coalesce(
+            Subquery(
+                model.objects
+                .filter(hub_id=OuterRef('hub_id'), is_deleted=False)
+                .values('hub_id')
+                .annotate(c=Count('pk'))
+                .values('c')
+            ),
+            0,
+        )
+
+    def compute():
+        # Three scalar subqueries in one round-trip, anchored on the
+        # per-hub settings row (get_settings creates it beforehand).
+        row = (
+            MessagingSettings.all_objects
+            .filter(hub_id=hub)
+            .annotate(
+                total_messages=count_subquery(Message),
+                total_templates=count_subquery(MessageTemplate),
+                total_campaigns=count_subquery(Campaign),
+            )
+            .values('total_messages', 'total_templates', 'total_campaigns')
+            .first()
+        )
+        if row is None:
+            # No settings row yet; fall back to plain counts.
+            row = {
+                'total_messages': Message.objects.filter(hub_id=hub, is_deleted=False).count(),
+                'total_templates': MessageTemplate.objects.filter(hub_id=hub, is_deleted=False).count(),
+                'total_campaigns': Campaign.objects.filter(hub_id=hub, is_deleted=False).count(),
+            }
+        return row
+    return cache.get_or_set(f'messaging:counters:{hub}', compute, COUNTERS_CACHE_TIMEOUT)
+
+
+@receiver(post_save, sender=Message)
+@receiver(post_delete, sender=Message)
+@receiver(post_save, sender=MessageTemplate)
+@receiver(post_delete, sender=MessageTemplate)
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def _invalidate_hub_counters(sender, instance, **kwargs):
+    """Drop the cached totals whenever a counted row changes."""
+    cache.delete(f'messaging:counters:{instance.hub_id}')
+
+
+def _list_cache_stamp(model, hub):
+    """Stamp for the list fragment caches in the partials.
+
+    Any write to a hub's rows bumps updated_at, so the cached fragment
+    is reused until the data actually changes. all_objects so
+    soft-deletes invalidate too.
+    """
+    return model.all_objects.filter(hub_id=hub).aggregate(m=Max('updated_at'))['m']
 
 
 PER_PAGE = 25
 
+# Channels the send APIs accept; frozenset membership beats rebuilding
+# a tuple per request on the hot path.
+_VALID_CHANNELS = frozenset(('whatsapp', 'sms', 'email'))
+
+# Columns the message list rows actually render; metadata, error details
+# and delivery timestamps only appear on the detail page.
+MESSAGE_LIST_FIELDS = (
+    'channel', 'recipient_name', 'recipient_contact',
+    'subject', 'body', 'status', 'created_at',
+)
+
 
 # ============================================================================
 # Dashboard
@@ -62,24 +204,22 @@ def dashboard(request):
     hub = _hub_id(request)
     today = timezone.now().date()
 
-    total_messages = Message.objects.filter(hub_id=hub, is_deleted=False).count()
-    sent_today = Message.objects.filter(
-        hub_id=hub, is_deleted=False,
-        created_at__date=today,
-    ).count()
-    delivered_count = Message.objects.filter(
-        hub_id=hub, is_deleted=False,
-        status__in=['delivered', 'read'],
-    ).count()
-    failed_count = Message.objects.filter(
-        hub_id=hub, is_deleted=False,
-        status='failed',
-    ).count()
+    # One conditional aggregation instead of four COUNT round-trips.
+    stats = Message.objects.filter(hub_id=hub, is_deleted=False).aggregate(
+        total=Count('id'),
+        sent_today=Count('id', filter=Q(created_at__date=today)),
+        delivered=Count('id', filter=Q(status__in=['delivered', 'read'])),
+        failed=Count('id', filter=Q(status='failed')),
+    )
+    total_messages = stats['total']
+    sent_today = stats['sent_today']
+    delivered_count = stats['delivered']
+    failed_count = stats['failed']
     delivery_rate = round((delivered_count / total_messages * 100), 1) if total_messages > 0 else 0
 
     recent_messages = Message.objects.filter(
         hub_id=hub, is_deleted=False,
-    ).order_by('-created_at')[:10]
+    ).only(*MESSAGE_LIST_FIELDS).order_by('-created_at')[:10]
 
     active_campaigns = Campaign.objects.filter(
         hub_id=hub, is_deleted=False,
@@ -116,7 +256,7 @@ def messages_list(request):
     channel_filter = request.GET.get('channel', '')
     status_filter = request.GET.get('status', '')
 
-    qs = Message.objects.filter(hub_id=hub, is_deleted=False)
+    qs = Message.objects.filter(hub_id=hub, is_deleted=False).only(*MESSAGE_LIST_FIELDS)
 
     if channel_filter:
         qs = qs.filter(channel=channel_filter)
@@ -153,7 +293,7 @@ def messages_list(request):
 def message_detail(request, pk):
     """View a single message."""
     hub = _hub_id(request)
-    message = get_object_or_404(Message, pk=pk, hub_id=hub, is_deleted=False)
+    message = _get_or_404(Message, pk, hub)
     return {'message': message}
 
 
@@ -178,7 +318,9 @@ def send_message(request):
 
             django_messages.success(request, _('Message sent successfully'))
             return django_render(request, 'messaging/partials/messages_content.html', {
-                'messages_list': Message.objects.filter(hub_id=hub, is_deleted=False)[:PER_PAGE],
+                'messages_list': Message.objects.filter(
+                    hub_id=hub, is_deleted=False,
+                ).only(*MESSAGE_LIST_FIELDS).order_by('-created_at')[:PER_PAGE],
                 'page_obj': None,
                 'search_query': '',
                 'channel_filter': '',
@@ -221,6 +363,20 @@ def send_message(request):
 # Templates
 # ============================================================================
 
+def _templates_qs(hub):
+    """Hub's live templates, projected onto the columns the cards render.
+
+    The compiled columns only matter when actually rendering a message.
+    Shared by the list view and the partial re-renders after template
+    create/edit/delete so the projection never diverges. created_by is
+    a plain UUID column, not an FK, so there is nothing to join.
+    """
+    return MessageTemplate.objects.filter(hub_id=hub, is_deleted=False).only(
+        'name', 'channel', 'category', 'subject', 'body',
+        'is_active', 'is_system',
+    )
+
+
 @login_required
 @with_module_nav('messaging', 'templates')
 @htmx_view('messaging/pages/templates.html', 'messaging/partials/templates_content.html')
@@ -229,16 +385,22 @@ def templates_list(request):
     hub = _hub_id(request)
     search_query = request.GET.get('q', '').strip()
 
-    qs = MessageTemplate.objects.filter(hub_id=hub, is_deleted=False)
+    qs = _templates_qs(hub)
     if search_query:
         qs = qs.filter(
             Q(name__icontains=search_query) |
             Q(body__icontains=search_query)
         )
 
+    paginator = Paginator(qs, PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get('page', 1))
+
     return {
-        'templates': qs,
+        'templates': page_obj,
+        'page_obj': page_obj,
         'search_query': search_query,
+        'hub': hub,
+        'cache_stamp': _list_cache_stamp(MessageTemplate, hub),
     }
 
 
@@ -257,8 +419,10 @@ def template_create(request):
             template.save()
             django_messages.success(request, _('Template created successfully'))
             return django_render(request, 'messaging/partials/templates_content.html', {
-                'templates': MessageTemplate.objects.filter(hub_id=hub, is_deleted=False),
+                'templates': _templates_qs(hub),
                 'search_query': '',
+                'hub': hub,
+                'cache_stamp': _list_cache_stamp(MessageTemplate, hub),
             })
     else:
         form = MessageTemplateForm()
@@ -275,7 +439,7 @@ def template_create(request):
 def template_edit(request, pk):
     """Edit an existing template."""
     hub = _hub_id(request)
-    template = get_object_or_404(MessageTemplate, pk=pk, hub_id=hub, is_deleted=False)
+    template = _get_or_404(MessageTemplate, pk, hub)
 
     if request.method == 'POST':
         form = MessageTemplateForm(request.POST, instance=template)
@@ -283,8 +447,10 @@ def template_edit(request, pk):
             form.save()
             django_messages.success(request, _('Template updated successfully'))
             return django_render(request, 'messaging/partials/templates_content.html', {
-                'templates': MessageTemplate.objects.filter(hub_id=hub, is_deleted=False),
+                'templates': _templates_qs(hub),
                 'search_query': '',
+                'hub': hub,
+                'cache_stamp': _list_cache_stamp(MessageTemplate, hub),
             })
     else:
         form = MessageTemplateForm(instance=template)
@@ -301,7 +467,7 @@ def template_edit(request, pk):
 def template_delete(request, pk):
     """Soft-delete a template."""
     hub = _hub_id(request)
-    template = get_object_or_404(MessageTemplate, pk=pk, hub_id=hub, is_deleted=False)
+    template = _get_or_404(MessageTemplate, pk, hub)
 
     if template.is_system:
         django_messages.error(request, _('System templates cannot be deleted'))
@@ -309,17 +475,30 @@ def template_delete(request, pk):
         template.delete()
         django_messages.success(request, _('Template deleted successfully'))
 
-    templates = MessageTemplate.objects.filter(hub_id=hub, is_deleted=False)
-    return django_render(request, 'messaging/partials/templates_content.html', {
-        'templates': templates,
-        'search_query': '',
-    })
+    # No body: the list partial listens for this trigger and refreshes
+    # itself, which beats re-querying and re-rendering it here.
+    return HttpResponse(status=204, headers={'HX-Trigger': 'messagingListChanged'})
 
 
 # ============================================================================
 # Campaigns
 # ============================================================================
 
+def _campaigns_qs(hub):
+    """Hub's live campaigns, projected onto the columns the cards render.
+
+    Rows render campaign.template.name; join it instead of one SELECT
+    per campaign. target_filter and the run timestamps only show on the
+    detail page. Shared by the list view and the partial re-render
+    after campaign create so the projection never diverges.
+    """
+    return Campaign.objects.filter(hub_id=hub, is_deleted=False).select_related('template').only(
+        'name', 'description', 'channel', 'status', 'scheduled_at',
+        'total_recipients', 'sent_count', 'delivered_count',
+        'template__name',
+    )
+
+
 @login_required
 @with_module_nav('messaging', 'campaigns')
 @htmx_view('messaging/pages/campaigns.html', 'messaging/partials/campaigns_content.html')
@@ -329,19 +508,29 @@ def campaigns_list(request):
     search_query = request.GET.get('q', '').strip()
     status_filter = request.GET.get('status', '')
 
-    qs = Campaign.objects.filter(hub_id=hub, is_deleted=False)
-    if status_filter:
+    qs = _campaigns_qs(hub)
+    # Only filter on real statuses; arbitrary strings would just force
+    # a guaranteed-empty scan.
+    if status_filter in CampaignStatusChoices.values:
         qs = qs.filter(status=status_filter)
+    else:
+        status_filter = ''
     if search_query:
         qs = qs.filter(
             Q(name__icontains=search_query) |
             Q(description__icontains=search_query)
         )
 
+    paginator = Paginator(qs, PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get('page', 1))
+
     return {
-        'campaigns': qs,
+        'campaigns': page_obj,
+        'page_obj': page_obj,
         'search_query': search_query,
         'status_filter': status_filter,
+        'hub': hub,
+        'cache_stamp': _list_cache_stamp(Campaign, hub),
     }
 
 
@@ -359,10 +548,14 @@ def campaign_create(request):
             campaign.hub_id = hub
             campaign.save()
             django_messages.success(request, _('Campaign created successfully'))
+            page_obj = Paginator(_campaigns_qs(hub), PER_PAGE).get_page(1)
             return django_render(request, 'messaging/partials/campaigns_content.html', {
-                'campaigns': Campaign.objects.filter(hub_id=hub, is_deleted=False),
+                'campaigns': page_obj,
+                'page_obj': page_obj,
                 'search_query': '',
                 'status_filter': '',
+                'hub': hub,
+                'cache_stamp': _list_cache_stamp(Campaign, hub),
             })
     else:
         form = CampaignForm()
@@ -382,7 +575,8 @@ def campaign_create(request):
 def campaign_detail(request, pk):
     """View campaign details and stats."""
     hub = _hub_id(request)
-    campaign = get_object_or_404(Campaign, pk=pk, hub_id=hub, is_deleted=False)
+    # The detail card renders campaign.template.name.
+    campaign = _get_or_404(Campaign, pk, hub, related=('template',))
     return {'campaign': campaign}
 
 
@@ -391,7 +585,7 @@ def campaign_detail(request, pk):
 def campaign_start(request, pk):
     """Start sending a campaign."""
     hub = _hub_id(request)
-    campaign = get_object_or_404(Campaign, pk=pk, hub_id=hub, is_deleted=False)
+    campaign = _get_or_404(Campaign, pk, hub)
 
     if campaign.status not in ('draft', 'scheduled'):
         django_messages.error(request, _('Campaign cannot be started in its current state'))
@@ -399,9 +593,8 @@ def campaign_start(request, pk):
         campaign.start()
         django_messages.success(request, _('Campaign started'))
 
-    return django_render(request, 'messaging/partials/campaign_detail_content.html', {
-        'campaign': campaign,
-    })
+    # The detail partial refreshes itself on this trigger.
+    return HttpResponse(status=204, headers={'HX-Trigger': 'messagingListChanged'})
 
 
 @login_required
@@ -409,7 +602,7 @@ def campaign_start(request, pk):
 def campaign_cancel(request, pk):
     """Cancel a campaign."""
     hub = _hub_id(request)
-    campaign = get_object_or_404(Campaign, pk=pk, hub_id=hub, is_deleted=False)
+    campaign = _get_or_404(Campaign, pk, hub)
 
     if campaign.status in ('completed', 'cancelled'):
         django_messages.error(request, _('Campaign is already finished'))
@@ -417,9 +610,8 @@ def campaign_cancel(request, pk):
         campaign.cancel()
         django_messages.success(request, _('Campaign cancelled'))
 
-    return django_render(request, 'messaging/partials/campaign_detail_content.html', {
-        'campaign': campaign,
-    })
+    # The detail partial refreshes itself on this trigger.
+    return HttpResponse(status=204, headers={'HX-Trigger': 'messagingListChanged'})
 
 
 # ============================================================================
@@ -433,9 +625,9 @@ def api_send(request):
     hub = _hub_id(request)
 
     try:
-        data = json.loads(request.body)
-    except (json.JSONDecodeError, ValueError):
-        return JsonResponse({'success': False, 'error': _('Invalid JSON')}, status=400)
+        data = _load_json(request.body)
+    except ValueError:
+        return _json_response({'success': False, 'error': _('Invalid JSON')}, status=400)
 
     channel = data.get('channel')
     recipient_contact = data.get('recipient_contact', '')
@@ -447,13 +639,13 @@ def api_send(request):
     metadata = data.get('metadata', {})
 
     if not channel or not recipient_contact or not body:
-        return JsonResponse({
+        return _json_response({
             'success': False,
             'error': 'channel, recipient_contact, and body are required',
         }, status=400)
 
-    if channel not in ('whatsapp', 'sms', 'email'):
-        return JsonResponse({
+    if channel not in _VALID_CHANNELS:
+        return _json_response({
             'success': False,
             'error': 'Invalid channel. Must be whatsapp, sms, or email',
         }, status=400)
@@ -474,13 +666,86 @@ def api_send(request):
     # In production this would queue for async sending
     msg.mark_sent()
 
-    return JsonResponse({
+    return _json_response({
         'success': True,
         'message_id': str(msg.pk),
         'status': msg.status,
     })
 
 
+@login_required
+@require_POST
+def api_send_batch(request):
+    """API endpoint to send a batch of messages in one request.
+
+    Programmatic callers pushing many notifications would otherwise pay
+    one INSERT plus one UPDATE per message through api_send; this
+    accepts {"messages": [...]} and does one bulk INSERT and one bulk
+    status UPDATE for the whole batch.
+    """
+    hub = _hub_id(request)
+
+    try:
+        data = _load_json(request.body)
+    except ValueError:
+        return _json_response({'success': False, 'error': _('Invalid JSON')}, status=400)
+
+    items = data.get('messages')
+    if not isinstance(items, list) or not items:
+        return _json_response({
+            'success': False,
+            'error': 'messages must be a non-empty list',
+        }, status=400)
+
+    rows = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            return _json_response({
+                'success': False,
+                'error': f'messages[{i}] must be an object',
+            }, status=400)
+
+        channel = item.get('channel')
+        recipient_contact = item.get('recipient_contact', '')
+        body = item.get('body', '')
+
+        if not channel or not recipient_contact or not body:
+            return _json_response({
+                'success': False,
+                'error': f'messages[{i}]: channel, recipient_contact, and body are required',
+            }, status=400)
+
+        if channel not in _VALID_CHANNELS:
+            return _json_response({
+                'success': False,
+                'error': f'messages[{i}]: invalid channel. Must be whatsapp, sms, or email',
+            }, status=400)
+
+        rows.append({
+            'hub_id': hub,
+            'channel': channel,
+            'recipient_name': item.get('recipient_name', ''),
+            'recipient_contact': recipient_contact,
+            'subject': item.get('subject', ''),
+            'body': body,
+            'status': MessageStatusChoices.QUEUED,
+            'template_id': item.get('template_id'),
+            'customer_id': item.get('customer_id'),
+            'metadata': item.get('metadata', {}),
+        })
+
+    msgs = Message.bulk_queue(rows)
+
+    # In production this would queue for async sending
+    Message.bulk_mark_sent([msg.pk for msg in msgs])
+
+    return _json_response({
+        'success': True,
+        'message_ids': [str(msg.pk) for msg in msgs],
+        'count': len(msgs),
+    })
+
+
 @public_view
 @csrf_exempt
 @require_POST
@@ -492,32 +757,52 @@ def api_webhook(request):
     No login required, CSRF exempt.
     """
     try:
-        data = json.loads(request.body)
-    except (json.JSONDecodeError, ValueError):
-        return JsonResponse({'error': _('Invalid JSON')}, status=400)
+        data = _load_json(request.body)
+    except ValueError:
+        return _json_response({'error': _('Invalid JSON')}, status=400)
 
     external_id = data.get('external_id', '')
     status = data.get('status', '')
     error_message = data.get('error', '')
 
     if not external_id or not status:
-        return JsonResponse({'error': 'external_id and status required'}, status=400)
-
-    try:
-        msg = Message.objects.get(external_id=external_id)
-    except Message.DoesNotExist:
-        return JsonResponse({'error': 'Message not found'}, status=404)
+        return _json_response({'error': 'external_id and status required'}, status=400)
+
+    # Providers retry callbacks aggressively; acknowledge repeats of an
+    # already-applied (external_id, status) pair without touching the DB.
+    dedupe_key = f'messaging:wh:{external_id}:{status}'
+    if cache.get(dedupe_key):
+        return _json_response({'success': True, 'deduped': True})
+
+    # One UPDATE keyed on the partial external_id index instead of a
+    # SELECT followed by a per-instance save.
+    now = timezone.now()
+    match status:
+        case 'delivered':
+            changes = {'status': MessageStatusChoices.DELIVERED, 'delivered_at': now}
+        case 'read':
+            changes = {'status': MessageStatusChoices.READ, 'read_at': now}
+        case 'failed':
+            changes = {'status': MessageStatusChoices.FAILED, 'error_message': error_message}
+        case 'sent':
+            changes = {'status': MessageStatusChoices.SENT, 'sent_at': now}
+        case _:
+            # Unknown statuses are acknowledged without a write, as before.
+            if not Message.objects.filter(external_id=external_id).exists():
+                return _json_response({'error': 'Message not found'}, status=404)
+            return _json_response({'success': True, 'updated': 0})
+
+    updated = Message.objects.filter(external_id=external_id).update(
+        updated_at=now, **changes,
+    )
+    if not updated:
+        return _json_response({'error': 'Message not found'}, status=404)
 
-    if status == 'delivered':
-        msg.mark_delivered()
-    elif status == 'read':
-        msg.mark_read()
-    elif status == 'failed':
-        msg.mark_failed(error=error_message)
-    elif status == 'sent':
-        msg.mark_sent()
+    # Marked only after a successful write so retries of a failed or
+    # unknown delivery still reach the DB (and keep their 404).
+    cache.add(dedupe_key, 1, 3600)
 
-    return JsonResponse({'success': True, 'message_id': str(msg.pk)})
+    return _json_response({'success': True, 'updated': updated})
 
 
 # ============================================================================
@@ -533,16 +818,7 @@ def settings_view(request):
     hub = _hub_id(request)
     settings = MessagingSettings.get_settings(hub)
 
-    total_messages = Message.objects.filter(hub_id=hub, is_deleted=False).count()
-    total_templates = MessageTemplate.objects.filter(hub_id=hub, is_deleted=False).count()
-    total_campaigns = Campaign.objects.filter(hub_id=hub, is_deleted=False).count()
-
-    return {
-        'settings': settings,
-        'total_messages': total_messages,
-        'total_templates': total_templates,
-        'total_campaigns': total_campaigns,
-    }
+    return {'settings': settings, **_hub_counters(hub)}
 
 
 @login_required
@@ -560,15 +836,9 @@ def settings_save(request):
     else:
         django_messages.error(request, _('Please correct the errors below'))
 
-    total_messages = Message.objects.filter(hub_id=hub, is_deleted=False).count()
-    total_templates = MessageTemplate.objects.filter(hub_id=hub, is_deleted=False).count()
-    total_campaigns = Campaign.objects.filter(hub_id=hub, is_deleted=False).count()
-
     return django_render(request, 'messaging/partials/settings_content.html', {
         'settings': settings,
-        'total_messages': total_messages,
-        'total_templates': total_templates,
-        'total_campaigns': total_campaigns,
+        **_hub_counters(hub),
     })
 
 
@@ -651,7 +921,7 @@ def automation_add(request):
 def automation_edit(request, pk):
     """Edit automation — side panel."""
     hub = _hub_id(request)
-    automation = get_object_or_404(MessageAutomation, pk=pk, hub_id=hub, is_deleted=False)
+    automation = _get_or_404(MessageAutomation, pk, hub)
     templates = MessageTemplate.objects.filter(
         hub_id=hub, is_deleted=False, is_active=True,
     ).order_by('name')
@@ -699,7 +969,7 @@ def automation_edit(request, pk):
 def automation_delete(request, pk):
     """Soft-delete automation."""
     hub = _hub_id(request)
-    automation = get_object_or_404(MessageAutomation, pk=pk, hub_id=hub, is_deleted=False)
+    automation = _get_or_404(MessageAutomation, pk, hub)
     automation.delete()
     django_messages.success(request, _('Automation deleted'))
 
@@ -714,7 +984,7 @@ def automation_delete(request, pk):
 def automation_toggle(request, pk):
     """Toggle automation active/inactive."""
     hub = _hub_id(request)
-    automation = get_object_or_404(MessageAutomation, pk=pk, hub_id=hub, is_deleted=False)
+    automation = _get_or_404(MessageAutomation, pk, hub)
     automation.is_active = not automation.is_active
     automation.save(update_fields=['is_active', 'updated_at'])
 